@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Benchmark the dashboard pipeline on synthetic catalogs of several sizes.
+
+Each stage (fetch, cache load/save, aggregate, print_summary, search_index,
+build_html) is timed best-of-N and then run once more under tracemalloc for its peak memory.
+Fetches go to an in-process fake_skills_api server, so no network is needed.
+
+Usage:
+    python3 benchmark.py                                  # 10k, 50k, 200k skills
+    python3 benchmark.py --sizes 10000,1000000 --repeat 5
+    python3 benchmark.py --baseline bench.json --save-baseline
+    python3 benchmark.py --baseline bench.json --threshold 0.25   # exit 1 on regression
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import scrape_and_build as sb
+from fake_skills_api import FakeSkillsAPI, iter_catalog
+
+DEFAULT_SIZES = [10_000, 50_000, 200_000]
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.25
+# Timing changes smaller than this are treated as noise, whatever the ratio.
+MIN_SECONDS_DELTA = 0.005
+# Stages that hit the disk or a socket vary far more between runs (+70% with
+# --repeat 1 on unchanged code), so they must also slow down by this multiple of
+# the threshold, and by at least MIN_IO_SECONDS_DELTA.
+IO_STAGES = {"fetch", "cache_load_sqlite", "cache_load_json", "cache_save_sqlite"}
+IO_THRESHOLD_FACTOR = 4
+MIN_IO_SECONDS_DELTA = 0.05
+
+
+def _stages(ctx: dict) -> dict:
+    """Stage name -> setup function returning the thunk to time.
+
+    Stages run in order and share ``ctx``: fetch stores the skills that the
+    later stages consume, aggregate stores the owners that rendering needs and
+    search_index the index that the page links to.
+    """
+    tmp: Path = ctx["tmp"]
+
+    def fresh_cache(backend: str):
+        ctx["caches"] = ctx.get("caches", 0) + 1
+        return sb.CACHE_BACKENDS[backend](cache_dir=tmp / f"cache-{ctx['caches']}")
+
+    def fetch(cache, refresh=True):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return sb._fetch_from_api(cache=cache, refresh=refresh, api_base=ctx["url"])
+
+    def warm_cache(backend: str):
+        key = f"warm-{backend}"
+        if key not in ctx:
+            ctx[key] = fresh_cache(backend)
+            fetch(ctx[key])
+        return ctx[key]
+
+    def stage_fetch():
+        cache = fresh_cache("sqlite")
+
+        def run():
+            ctx["skills"] = fetch(cache)
+        return run
+
+    def stage_cache_load(backend):
+        def setup():
+            cache = warm_cache(backend)
+            return lambda: fetch(cache, refresh=False)
+        return setup
+
+    def stage_cache_save():
+        cache = fresh_cache("sqlite")
+        return lambda: cache.save_catalog(sb.SEARCH_QUERIES, ctx["skills"])
+
+    def stage_aggregate():
+        def run():
+            ctx["owners"] = sb.aggregate(ctx["skills"], top_k=sb.DEFAULT_TOP_K, skills_per_group=sb.DEFAULT_MAX_CHILDREN)
+        return run
+
+    def stage_print_summary():
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                sb.print_summary(ctx["owners"])
+        return run
+
+    def stage_search_index():
+        aggregator = sb.Aggregator("owner")
+        for s in ctx["skills"]:
+            aggregator.add(s)
+        totals = aggregator.totals()
+
+        def run():
+            ctx["search"] = sb.build_search_index(ctx["skills"], totals)
+        return run
+
+    def stage_build_html():
+        def run():
+            # As main() does by default: the index is written as a script the page loads on first use.
+            filename, body = sb._search_script_file(ctx["search"])
+            with contextlib.redirect_stdout(io.StringIO()):
+                page = sb.build_html(sb.level_of_detail(ctx["owners"]), search=f"data/{filename}")
+            ctx["html_bytes"] = len(page.encode("utf-8"))
+            ctx["search_bytes"] = len(body)
+        return run
+
+    return {
+        "fetch": stage_fetch,
+        "cache_load_sqlite": stage_cache_load("sqlite"),
+        "cache_load_json": stage_cache_load("json"),
+        "cache_save_sqlite": stage_cache_save,
+        "aggregate": stage_aggregate,
+        "print_summary": stage_print_summary,
+        "search_index": stage_search_index,
+        "build_html": stage_build_html,
+    }
+
+
+def _measure(setup, repeat: int) -> dict:
+    """Best-of-``repeat`` wall time, then one tracemalloc run for peak memory."""
+    best = float("inf")
+    for _ in range(repeat):
+        run = setup()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    run = setup()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": round(best, 6), "peak_kb": round(peak / 1024)}
+
+
+def run_benchmarks(sizes: list[int], repeat: int = DEFAULT_REPEAT, seed: int = 0) -> dict:
+    """Run every stage at every catalog size; return the results document."""
+    results = {}
+    for size in sizes:
+        print(f"Catalog of {size:,} skills:")
+        api = FakeSkillsAPI(iter_catalog(size, seed=seed))
+        url = api.start()
+        for q in sb.SEARCH_QUERIES:  # memoize server responses outside the timings
+            api.search(q, 100_000)
+        with tempfile.TemporaryDirectory(prefix="skills-bench-") as tmp:
+            ctx = {"tmp": Path(tmp), "url": url}
+            stages = {}
+            for name, setup in _stages(ctx).items():
+                stages[name] = _measure(setup, repeat)
+                print(f"  {name:18s} {stages[name]['seconds'] * 1000:>10,.1f} ms {stages[name]['peak_kb']:>10,} KB peak")
+            print(f"  {'html_bytes':18s} {ctx['html_bytes']:>13,}")
+            print(f"  {'search_bytes':18s} {ctx['search_bytes']:>13,}")
+        api.stop()
+        results[str(size)] = {
+            "unique_skills": len(ctx["skills"]),
+            "html_bytes": ctx["html_bytes"],
+            "search_bytes": ctx["search_bytes"],
+            "stages": stages,
+        }
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "seed": seed,
+        "sizes": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Regressions of ``current`` over ``baseline`` beyond ``threshold`` (a ratio)."""
+    regressions = []
+    for size, now in current["sizes"].items():
+        base = baseline["sizes"].get(size)
+        if base is None:
+            continue
+        checks = [
+            (f"{size} {key}", base[key], now[key], threshold, 0)
+            for key in ("html_bytes", "search_bytes") if key in base
+        ]
+        for stage, metrics in now["stages"].items():
+            if stage not in base["stages"]:
+                continue
+            old = base["stages"][stage]
+            if stage in IO_STAGES:
+                seconds = (threshold * IO_THRESHOLD_FACTOR, MIN_IO_SECONDS_DELTA)
+            else:
+                seconds = (threshold, MIN_SECONDS_DELTA)
+            checks.append((f"{size} {stage} seconds", old["seconds"], metrics["seconds"], *seconds))
+            checks.append((f"{size} {stage} peak_kb", old["peak_kb"], metrics["peak_kb"], threshold, 0))
+        for label, old, new, allowed, slack in checks:
+            if new > old * (1 + allowed) and new - old > slack:
+                regressions.append(f"{label}: {old:,} -> {new:,} (+{(new / old - 1) * 100 if old else float('inf'):.0f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the skills dashboard pipeline")
+    parser.add_argument(
+        "--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+        help="Comma-separated catalog sizes (default: %(default)s)",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per stage; the best counts")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic catalog seed")
+    parser.add_argument("--baseline", metavar="PATH", help="Baseline results to compare against (or save to)")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run's results to --baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help=f"Allowed slowdown/growth over the baseline as a ratio (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument("--json", metavar="PATH", help="Also write this run's results to PATH")
+    args = parser.parse_args()
+    if args.save_baseline and not args.baseline:
+        parser.error("--save-baseline needs --baseline PATH")
+    try:
+        sizes = [int(s) for s in args.sizes.split(",") if s]
+    except ValueError:
+        parser.error(f"--sizes expects comma-separated integers, got {args.sizes!r}")
+
+    results = run_benchmarks(sizes, repeat=args.repeat, seed=args.seed)
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2) + "\n")
+    if args.save_baseline:
+        Path(args.baseline).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+        return
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.baseline} (threshold {args.threshold:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions over {args.baseline} (threshold {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
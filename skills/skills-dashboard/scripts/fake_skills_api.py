@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the skills.sh search API, for offline scraping tests.
+
+Serves /api/search?q=&limit= over a synthetic catalog with power-law installs
+and skewed publisher sizes, and can inject latency, bandwidth caps, hung
+requests and 5xx/429 bursts.
+
+Usage:
+    python3 fake_skills_api.py --skills 100000 --port 8787
+    python3 fake_skills_api.py --latency-ms 200 --bandwidth-kbps 2000 --burst 429:20:3
+    SKILLS_API_BASE=http://127.0.0.1:8787/api/search python3 scrape_and_build.py
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+import zlib
+from collections.abc import Iterator
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Word pool for synthetic skill names; common English/tech bigrams keep the
+# scraper's 2-char SEARCH_QUERIES coverage realistic.
+WORDS = [
+    "skill", "react", "python", "testing", "design", "agent", "review", "docs",
+    "api", "deploy", "security", "data", "writer", "search", "browser", "git",
+    "commit", "frontend", "backend", "swift", "golang", "java", "rust", "ux",
+    "prompt", "analysis", "workflow", "expert", "helper", "builder", "guide",
+    "query", "mobile", "cloud", "infra", "marketing", "research", "hygiene",
+    "physics", "music", "zylo", "ops", "best-practices", "creator", "mcp",
+]
+
+
+def iter_catalog(size: int, seed: int = 0) -> Iterator[dict]:
+    """Yield ``size`` synthetic skills in the API's record shape.
+
+    Installs follow a Pareto distribution and skills are spread over publishers
+    with a heavy skew, so a few owners publish most skills, as on skills.sh.
+    """
+    rng = random.Random(seed)
+    n_owners = max(10, size // 8)
+    for i in range(size):
+        owner_idx = int(n_owners * rng.random() ** 3)
+        owner = f"{WORDS[owner_idx % len(WORDS)]}-labs-{owner_idx}"
+        repo = f"{WORDS[(owner_idx * 7 + min(int(rng.paretovariate(1.5)), 20)) % len(WORDS)]}-skills"
+        skill_id = f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{i:x}"
+        source = f"{owner}/{repo}"
+        yield {
+            "id": f"{source}/{skill_id}",
+            "skillId": skill_id,
+            "name": skill_id,
+            "installs": min(int(rng.paretovariate(0.8)) - 1, 10_000_000),
+            "source": source,
+        }
+
+
+class Faults:
+    """Fault injection settings, shared by all request handlers."""
+
+    def __init__(
+        self,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        bandwidth_kbps: float = 0,
+        error_rate: float = 0,
+        timeout_rate: float = 0,
+        hang_seconds: float = 90,
+        bursts: list[tuple[int, int, int]] | None = None,
+        seed: int = 0,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.bandwidth_kbps = bandwidth_kbps
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.hang_seconds = hang_seconds
+        self.bursts = bursts or []  # (status, every N requests, burst length)
+        self._rng = random.Random(seed)
+        self._requests = 0
+        self._lock = threading.Lock()
+
+    def next_request(self) -> tuple[str, int | None]:
+        """Decide the fate of the next request: ("ok" | "hang" | "error", status)."""
+        with self._lock:
+            n = self._requests
+            self._requests += 1
+            roll = self._rng.random()
+        for status, every, length in self.bursts:
+            if n % every >= every - length:
+                return "error", status
+        if roll < self.timeout_rate:
+            return "hang", None
+        if roll < self.timeout_rate + self.error_rate:
+            return "error", 500
+        return "ok", 200
+
+    def delay(self) -> float:
+        with self._lock:
+            jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+
+class FakeSkillsAPI:
+    """The stand-in server: a catalog, fault settings and a threaded HTTP server.
+
+    Each skill is kept as its pre-serialized JSON fragment, so a million-skill
+    catalog stays affordable, and encoded responses are memoized per query.
+    """
+
+    def __init__(self, catalog: Iterator[dict], faults: Faults | None = None, host: str = "127.0.0.1", port: int = 0):
+        self.faults = faults or Faults()
+        self._ids: list[str] = []
+        self._fragments: list[str] = []
+        for skill in catalog:
+            self._ids.append(skill["id"].lower())
+            self._fragments.append(json.dumps(skill, separators=(",", ":")))
+        self.last_modified = formatdate(time.time(), usegmt=True)
+        self._responses: dict[tuple[str, int], bytes] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/search"
+
+    def search(self, query: str, limit: int) -> bytes:
+        """The JSON body for a search, memoized per (query, limit)."""
+        key = (query.lower(), limit)
+        with self._lock:
+            body = self._responses.get(key)
+        if body is None:
+            q = key[0]
+            matches = [frag for id_, frag in zip(self._ids, self._fragments) if q in id_][:limit]
+            body = (
+                f'{{"query":{json.dumps(query)},"searchType":"fuzzy","skills":[{",".join(matches)}],'
+                f'"count":{len(matches)}}}'
+            ).encode("utf-8")
+            with self._lock:
+                self._responses[key] = body
+        return body
+
+    def start(self) -> str:
+        """Serve in a background thread; return the API base URL."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                if url.path != "/api/search":
+                    self._send(404, b'{"error":"not found"}')
+                    return
+                fate, status = api.faults.next_request()
+                time.sleep(api.faults.delay())
+                if fate == "hang":
+                    time.sleep(api.faults.hang_seconds)
+                    self.close_connection = True
+                    return
+                if fate == "error":
+                    headers = {"Retry-After": "1"} if status == 429 else {}
+                    self._send(status, b'{"error":"injected failure"}', headers)
+                    return
+
+                params = parse_qs(url.query)
+                try:
+                    limit = int(params.get("limit", ["50"])[0])
+                except ValueError:
+                    self._send(400, b'{"error":"bad limit"}')
+                    return
+                body = api.search(params.get("q", [""])[0], limit)
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                headers = {"ETag": etag, "Last-Modified": api.last_modified}
+                if self.headers.get("If-None-Match") == etag:
+                    self._send(304, b"", headers)
+                    return
+                encoding = self.headers.get("Accept-Encoding", "")
+                if "gzip" in encoding:
+                    body, headers["Content-Encoding"] = gzip.compress(body, compresslevel=5), "gzip"
+                elif "deflate" in encoding:
+                    body, headers["Content-Encoding"] = zlib.compress(body, 5), "deflate"
+                self._send(200, body, headers)
+
+            def _send(self, status: int, body: bytes, headers: dict | None = None) -> None:
+                self.send_response(status)
+                if status != 304:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)) if status != 304 else "0")
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if status == 304 or not body:
+                    return
+                bandwidth = api.faults.bandwidth_kbps * 1024
+                if not bandwidth:
+                    self.wfile.write(body)
+                    return
+                chunk = max(1024, int(bandwidth / 20))
+                for start in range(0, len(body), chunk):
+                    self.wfile.write(body[start:start + chunk])
+                    time.sleep(min(chunk, len(body) - start) / bandwidth)
+
+        return Handler
+
+
+def _parse_burst(spec: str) -> tuple[int, int, int]:
+    try:
+        status, every, length = (int(part) for part in spec.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected STATUS:EVERY:LENGTH, got {spec!r}")
+    if every <= 0 or not 0 < length <= every:
+        raise argparse.ArgumentTypeError(f"need 0 < LENGTH <= EVERY, got {spec!r}")
+    return status, every, length
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic skills.sh search API locally")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--skills", type=int, default=50_000, help="Synthetic catalog size (default: 50000)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the catalog and fault rolls")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay before every response")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Uniform +/- jitter on the latency")
+    parser.add_argument("--bandwidth-kbps", type=float, default=0, help="Cap response bodies at this rate (KB/s)")
+    parser.add_argument("--error-rate", type=float, default=0, help="Probability of a 500 response")
+    parser.add_argument("--timeout-rate", type=float, default=0, help="Probability of hanging without a response")
+    parser.add_argument("--hang-seconds", type=float, default=90, help="How long a hung request stalls (default: 90)")
+    parser.add_argument(
+        "--burst", type=_parse_burst, action="append", default=[], metavar="STATUS:EVERY:LENGTH",
+        help="Fail the last LENGTH of every EVERY requests with STATUS, e.g. 429:20:3 (repeatable)",
+    )
+    args = parser.parse_args()
+
+    faults = Faults(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        bandwidth_kbps=args.bandwidth_kbps,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        hang_seconds=args.hang_seconds,
+        bursts=args.burst,
+        seed=args.seed,
+    )
+    print(f"Generating {args.skills:,} synthetic skills...")
+    api = FakeSkillsAPI(iter_catalog(args.skills, seed=args.seed), faults, host=args.host, port=args.port)
+    print(f"Serving {len(api):,} skills at {api.url}")
+    print(f"Point the scraper at it with: SKILLS_API_BASE={api.url}")
+    try:
+        api.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,25 +6,69 @@ Usage:
     python3 scrape_and_build.py
     python3 scrape_and_build.py --output /path/to/dashboard.html
     python3 scrape_and_build.py --json  # also dump raw JSON
+    python3 scrape_and_build.py --export ndjson --export sqlite  # streaming exports
+    python3 scrape_and_build.py --concurrency 16  # parallel API queries
+    python3 scrape_and_build.py --api-base http://127.0.0.1:8787/api/search  # local stand-in
+    python3 scrape_and_build.py --profile --metrics-json metrics.json  # timings report
+    python3 scrape_and_build.py --publisher-pages publishers  # one page per publisher
+    python3 scrape_and_build.py --serve 8000  # serve from memory, re-polling hourly
 """
 
 import argparse
+import base64
+import bisect
+import codecs
+import contextlib
+import csv
+import gzip
+import hashlib
+import heapq
+import html
+import http.client
+import itertools
 import json
+import math
 import os
+import re
+import sqlite3
+import subprocess
 import sys
+import threading
 import time
-import urllib.error
+import urllib.parse
 import urllib.request
+import zlib
+from abc import ABC, abstractmethod
+from array import array
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+try:
+    import brotli  # optional: also emit .br variants of --split-assets files
+except ImportError:
+    brotli = None
+
+try:
+    import fcntl  # optional: cross-process fetch lock on the cache (Unix only)
+except ImportError:
+    fcntl = None
+
+try:
+    import resource  # optional: peak RSS in --profile / --metrics-json (Unix only)
+except ImportError:
+    resource = None
+
 CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "skills-dashboard"
-CACHE_FILE = CACHE_DIR / "skills_cache.json"
 CACHE_MAX_AGE_HOURS = 1
 
 
-API_BASE = "https://skills.sh/api/search"
+DEFAULT_API_BASE = "https://skills.sh/api/search"
+# Point the scraper at another server (e.g. scripts/fake_skills_api.py) without editing code.
+API_BASE = os.environ.get("SKILLS_API_BASE", DEFAULT_API_BASE)
 # Broad 2-char queries that collectively cover ~99%+ of all skills.
 # Ordered by yield (most new results first) to minimize wasted requests.
 SEARCH_QUERIES = [
@@ -33,135 +77,1908 @@ SEARCH_QUERIES = [
     "st", "le", "ng", "io", "us", "ab", "op", "gu", "hy", "ux",
     "ex", "ph", "qu", "zy", "mu", "py", "go", "ja", "sw", "wo",
 ]
-
-
-def _fetch_query(query: str, limit: int = 100_000, retries: int = 3) -> list[dict]:
-    """Fetch skills matching a search query from the skills.sh API."""
-    url = f"{API_BASE}?q={query}&limit={limit}"
-    req = urllib.request.Request(url, headers={"User-Agent": "skills-dashboard/1.0"})
-    for attempt in range(retries):
+# Number of search queries in flight at once; 1 reproduces the old serial scrape.
+DEFAULT_CONCURRENCY = 8
+
+
+class RunMetrics:
+    """Instrumentation for one run, emitted by --profile and --metrics-json.
+
+    Records wall and CPU time per phase, per-query fetch stats (latency, wire
+    bytes, retries, records, new unique skills, cache outcome), output file
+    sizes and peak RSS. CPU time is process-wide, so it includes every fetch
+    thread. Phases may repeat; their times accumulate.
+    """
+
+    QUERY_FIELDS = {
+        "seconds": 0.0, "ttfb_s": None, "bytes": 0, "records": 0, "retries": 0, "new_unique": 0, "outcome": None,
+    }
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.phases: dict[str, dict] = {}
+        self.queries: dict[str, dict] = {}
+        self.outputs: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        with self._lock:  # register on entry so nested phases list after their parent
+            totals = self.phases.setdefault(name, {"wall_s": 0.0, "cpu_s": 0.0})
+        wall, cpu = time.perf_counter(), time.process_time()
         try:
-            with urllib.request.urlopen(req, timeout=60) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
-            return data.get("skills", [])
-        except (urllib.error.URLError, TimeoutError) as e:
-            if attempt < retries - 1:
-                wait = 2 ** attempt
-                print(f"    Retry {attempt + 1}/{retries} for q={query} ({e}), waiting {wait}s...")
-                time.sleep(wait)
+            yield
+        finally:
+            with self._lock:
+                totals["wall_s"] += time.perf_counter() - wall
+                totals["cpu_s"] += time.process_time() - cpu
+
+    def query(self, query: str) -> dict:
+        """The mutable stats dict for ``query``, created on first use."""
+        with self._lock:
+            return self.queries.setdefault(query, dict(self.QUERY_FIELDS))
+
+    def output(self, path: str | Path, size: int) -> None:
+        self.outputs[str(path)] = size
+
+    @staticmethod
+    def peak_rss_kb() -> int | None:
+        if resource is None:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak  # macOS reports bytes
+
+    def report(self) -> dict:
+        """The machine-readable run report."""
+        outcomes = defaultdict(int)
+        for stats in self.queries.values():
+            if stats["outcome"]:
+                outcomes[stats["outcome"]] += 1
+        return {
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.started_at)),
+            "wall_s": round(time.time() - self.started_at, 6),
+            "phases": {
+                name: {k: round(v, 6) for k, v in totals.items()} for name, totals in self.phases.items()
+            },
+            "queries": self.queries,
+            "fetch": {
+                "bytes": sum(q["bytes"] for q in self.queries.values()),
+                "records": sum(q["records"] for q in self.queries.values()),
+                "retries": sum(q["retries"] for q in self.queries.values()),
+            },
+            "cache": dict(outcomes),
+            "peak_rss_kb": self.peak_rss_kb(),
+            "outputs": self.outputs,
+        }
+
+    def print_profile(self) -> None:
+        report = self.report()
+        print(f"\nProfile ({report['wall_s']:.2f}s wall, peak RSS {report['peak_rss_kb'] or 0:,} KB):")
+        for name, totals in report["phases"].items():
+            print(f"  {name:18s} {totals['wall_s']:>9.3f}s wall {totals['cpu_s']:>9.3f}s cpu")
+        fetch = report["fetch"]
+        print(f"  fetched {fetch['bytes']:,} bytes, {fetch['records']:,} records, {fetch['retries']} retries")
+        fetched = [(q, stats) for q, stats in self.queries.items() if stats["seconds"]]
+        slowest = sorted(fetched, key=lambda kv: -kv[1]["seconds"])[:5]
+        if slowest:
+            print("  slowest queries: " + ", ".join(f"{q}={stats['seconds']:.2f}s" for q, stats in slowest))
+        for path, size in report["outputs"].items():
+            print(f"  wrote {path} ({size:,} bytes)")
+
+
+class SkillsClient:
+    """Keep-alive HTTP client for the skills.sh API, shared by all query fetches.
+
+    Idle connections are pooled and reused across threads so each request skips
+    the TCP+TLS handshake, and responses are requested with gzip/deflate and
+    decompressed transparently.
+
+    Proxies come from the environment as urllib would find them (``HTTPS_PROXY``,
+    ``HTTP_PROXY``, ``NO_PROXY``): HTTPS is tunneled through the proxy with
+    CONNECT, and plain HTTP requests are sent to it with the absolute URL.
+    """
+
+    def __init__(self, base_url: str | None = None, timeout: float = 60, max_idle: int = DEFAULT_CONCURRENCY):
+        parts = urllib.parse.urlsplit(base_url or API_BASE)
+        self.path = parts.path or "/"
+        self._conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._netloc = parts.netloc
+        self._url_prefix = ""
+        self._tunnel: tuple[str, dict] | None = None
+        self._proxy_headers: dict[str, str] = {}
+        proxy = urllib.request.getproxies().get(parts.scheme)
+        if proxy and not urllib.request.proxy_bypass(parts.hostname or ""):
+            proxy_parts = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+            self._netloc = proxy_parts.hostname + (f":{proxy_parts.port}" if proxy_parts.port else "")
+            auth = {}
+            if proxy_parts.username is not None:
+                user, password = (urllib.parse.unquote(v or "") for v in (proxy_parts.username, proxy_parts.password))
+                auth["Proxy-Authorization"] = "Basic " + base64.b64encode(f"{user}:{password}".encode()).decode("ascii")
+            if parts.scheme == "https":
+                self._tunnel = (parts.netloc, auth)
             else:
+                self._url_prefix = f"http://{parts.netloc}"
+                self._proxy_headers = auth
+        self._timeout = timeout
+        self._max_idle = max_idle
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        conn = self._conn_cls(self._netloc, timeout=self._timeout)
+        if self._tunnel:
+            conn.set_tunnel(self._tunnel[0], headers=self._tunnel[1])
+        return conn, False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self._max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def open(self, params: dict, headers: dict | None = None) -> "_Response":
+        """GET the API path with ``params`` and return the response, body unread.
+
+        Use the result as a context manager: the connection returns to the pool
+        only if the body was read to the end.
+        """
+        url = f"{self._url_prefix}{self.path}?{urllib.parse.urlencode(params)}"
+        headers = {
+            "User-Agent": "skills-dashboard/1.0", "Accept-Encoding": "gzip, deflate",
+            **self._proxy_headers, **(headers or {}),
+        }
+        while True:
+            conn, reused = self._acquire()
+            try:
+                conn.request("GET", url, headers=headers)
+                return _Response(self, conn, conn.getresponse())
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive connection; retry on a fresh one.
+            except BaseException:
+                conn.close()
                 raise
 
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class _Response:
+    """An open API response whose body is decompressed as it is read."""
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, client: SkillsClient, conn: http.client.HTTPConnection, resp: http.client.HTTPResponse):
+        self.status = resp.status
+        self._client = client
+        self._conn = conn
+        self._resp = resp
+        self._encoding = (resp.getheader("Content-Encoding") or "").strip().lower()
+        self.bytes_read = 0  # on the wire, before decompression
+
+    def __enter__(self) -> "_Response":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._resp.isclosed() and not self._resp.will_close:
+            self._client._release(self._conn)
+        else:
+            self._conn.close()
+
+    def getheader(self, name: str) -> str | None:
+        return self._resp.getheader(name)
+
+    def read(self) -> bytes:
+        """Read and return the whole decompressed body."""
+        return b"".join(self.iter_bytes())
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        """Yield the decompressed body in chunks as it arrives."""
+        inflater = None
+        while chunk := self._resp.read(self.CHUNK_SIZE):
+            self.bytes_read += len(chunk)
+            if self._encoding in ("gzip", "x-gzip", "deflate"):
+                if inflater is None:
+                    inflater = zlib.decompressobj(_inflate_wbits(self._encoding, chunk))
+                chunk = inflater.decompress(chunk)
+            yield chunk
+        if inflater is not None:
+            yield inflater.flush()
+
+    def iter_text(self) -> Iterator[str]:
+        """Yield the body as UTF-8 text chunks."""
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        for chunk in self.iter_bytes():
+            yield decoder.decode(chunk)
+        yield decoder.decode(b"", final=True)
+
+
+def _inflate_wbits(encoding: str, head: bytes) -> int:
+    """Pick zlib window bits for a gzip or deflate body starting with ``head``."""
+    if encoding != "deflate":
+        return 16 + zlib.MAX_WBITS
+    # "deflate" should be zlib-wrapped, but some servers send raw deflate.
+    if len(head) >= 2 and head[0] & 0x0F == 8 and int.from_bytes(head[:2], "big") % 31 == 0:
+        return zlib.MAX_WBITS
+    return -zlib.MAX_WBITS
+
+
+class _JsonStream:
+    """Minimal pull parser over a stream of JSON text chunks.
+
+    Only the structure around the values we care about is walked by hand; each
+    complete value is handed to ``json.JSONDecoder.raw_decode``.
+    """
+
+    _WS = re.compile(r"[ \t\n\r]*")
+    _NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        for chunk in self._chunks:
+            if chunk:
+                self._buf = self._buf[self._pos:] + chunk
+                self._pos = 0
+                return True
+        self._eof = True
+        return False
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ("" at EOF)."""
+        if self._pos < len(self._buf) and self._buf[self._pos] not in " \t\n\r":
+            return self._buf[self._pos]
+        while True:
+            self._pos = self._WS.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def take(self, expected: str) -> str:
+        """Consume the next non-whitespace character, which must be in ``expected``."""
+        ch = self.peek()
+        if not ch or ch not in expected:
+            raise ValueError(f"Malformed JSON stream: expected one of {expected!r}, got {ch!r}")
+        self._pos += 1
+        return ch
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number cut off by the chunk boundary may continue in the next chunk.
+            if (end == len(self._buf) or self._buf[end] in self._NUMBER_CHARS) and not self._eof and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+    def iter_array(self) -> Iterator:
+        """Yield the elements of the array starting at the current position."""
+        self.take("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.take(",]") == "]":
+                return
+
+
+def _iter_skills(chunks: Iterable[str]) -> Iterator[dict]:
+    """Yield the entries of the top-level "skills" array of a search response."""
+    stream = _JsonStream(chunks)
+    stream.take("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        key = stream.value()
+        stream.take(":")
+        if key == "skills":
+            yield from stream.iter_array()
+        else:
+            stream.value()
+        if stream.take(",}") == "}":
+            return
+
+
+SKILL_FIELDS = ("id", "name", "source", "installs")
+
+
+class Skill:
+    """One skill, projected to the API fields the dashboard uses (SKILL_FIELDS).
+
+    A ``__slots__`` record rather than the parsed API dict: the repeated source
+    and owner strings are interned, and the name is not stored when it is just
+    the tail of the id ("owner/repo/name"), as it usually is. That takes a skill
+    from about 440 to about 210 bytes. ``owner`` is derived from ``source`` and
+    is not serialized.
+    """
+
+    __slots__ = ("id", "_name", "source", "owner", "installs")
+
+    def __init__(self, id: str, name: str, source: str, installs: int):
+        self.id = id
+        self.source = sys.intern(source)
+        self.owner = sys.intern(source.partition("/")[0])
+        self._name = None if id == f"{source}/{name}" else name
+        self.installs = installs
+
+    @property
+    def name(self) -> str:
+        return self.id[len(self.source) + 1:] if self._name is None else self._name
+
+    @classmethod
+    def from_api(cls, record: dict) -> "Skill":
+        return cls(record["id"], record["name"], record["source"], record["installs"])
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in SKILL_FIELDS}
+
+    def __repr__(self) -> str:
+        return f"Skill({self.id!r}, installs={self.installs})"
+
+
+def _fetch_query(
+    query: str,
+    limit: int = 100_000,
+    retries: int = 3,
+    client: SkillsClient | None = None,
+    cache: "_QueryCache | None" = None,
+    meta: dict | None = None,
+    stats: dict | None = None,
+) -> Iterator[Skill]:
+    """Stream skills matching a search query from the skills.sh API.
+
+    Records are yielded as they are parsed off the socket, so only about one
+    chunk of the response is held in memory. A failed attempt restarts the
+    query from scratch, so callers may see a record twice and must dedupe by id.
+
+    With a ``cache``, records are written through to it. If ``meta`` is a
+    cached entry with validators the request is conditional, and a 304 replays
+    the cached records instead of downloading them again.
+
+    A ``stats`` dict (see RunMetrics.query) is updated with latency, wire
+    bytes, retries and the number of records yielded.
+    """
+    stats = stats if stats is not None else dict(RunMetrics.QUERY_FIELDS)
+    started = time.perf_counter()
+    own_client = client is None
+    client = client or SkillsClient()
+    headers = cache.validators(meta) if cache is not None and meta is not None else {}
+    try:
+        for attempt in range(retries):
+            resp = None
+            try:
+                with client.open({"q": query, "limit": limit}, headers) as resp:
+                    stats["ttfb_s"] = time.perf_counter() - started
+                    if resp.status == 304 and headers:
+                        resp.read()
+                    elif resp.status != 200:
+                        raise http.client.HTTPException(f"HTTP {resp.status}")
+                    else:
+                        records = map(Skill.from_api, _iter_skills(resp.iter_text()))
+                        if cache is not None:
+                            fresh_meta = {
+                                "timestamp": time.time(),
+                                "etag": resp.getheader("ETag"),
+                                "last_modified": resp.getheader("Last-Modified"),
+                            }
+                            records = cache.write_records(query, records, fresh_meta)
+                        for record in records:
+                            stats["records"] += 1
+                            yield record
+                        stats["seconds"] = time.perf_counter() - started
+                        if cache is not None:
+                            cache.set_outcome(query, "miss")
+                        return
+                cache.save_meta(query, {**meta, "timestamp": time.time()})
+                cache.set_outcome(query, "revalidated")
+                for record in cache.iter_records(query):
+                    stats["records"] += 1
+                    yield record
+                stats["seconds"] = time.perf_counter() - started
+                return
+            except (OSError, http.client.HTTPException, zlib.error) as e:
+                stats["records"] = 0
+                if attempt < retries - 1:
+                    stats["retries"] += 1
+                    wait = 2 ** attempt
+                    print(f"    Retry {attempt + 1}/{retries} for q={query} ({e}), waiting {wait}s...")
+                    time.sleep(wait)
+                else:
+                    raise
+            finally:
+                if resp is not None:
+                    stats["bytes"] += resp.bytes_read
+    finally:
+        if own_client:
+            client.close()
+
+
+@contextlib.contextmanager
+def _atomic_file(path: str | Path, mode: str = "w") -> Iterator:
+    """Open a temporary file that is renamed over ``path`` once the block succeeds.
+
+    Text mode is UTF-8 with newlines written as is, and writes are buffered,
+    so callers can stream records into it one at a time.
+    """
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    text = {} if "b" in mode else {"encoding": "utf-8", "newline": ""}
+    try:
+        with open(tmp, mode, buffering=1 << 16, **text) as f:
+            yield f
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _write_atomic(path: str | Path, data: bytes | str) -> None:
+    """Write ``path`` via a temporary file and a rename, so readers never see a partial file."""
+    with _atomic_file(path, "wb") as f:
+        f.write(data.encode("utf-8") if isinstance(data, str) else data)
+
+
+class _QueryCache(ABC):
+    """Per-query cache of search results, with a pluggable storage backend.
+
+    Every query's entry holds its records plus the fetch time and the response
+    validators (ETag / Last-Modified), so an expired entry can be revalidated
+    with a conditional request. ``stale_hours`` lets entries count as fresh
+    for that long past their TTL (see fetch_skills). Subclasses implement the
+    abstract storage methods; the catalog and crawl hooks are optional.
+    """
+
+    def __init__(
+        self,
+        max_age_hours: float = CACHE_MAX_AGE_HOURS,
+        query_max_age_hours: dict[str, float] | None = None,
+        cache_dir: Path | None = None,
+        stale_hours: float = 0,
+    ):
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.max_age_hours = max_age_hours
+        self.query_max_age_hours = query_max_age_hours or {}
+        self.stale_hours = stale_hours
+        self.outcomes: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def ttl_hours(self, query: str) -> float:
+        return self.query_max_age_hours.get(query, self.max_age_hours)
+
+    def is_fresh(self, query: str, meta: dict) -> bool:
+        return (time.time() - meta["timestamp"]) / 3600 <= self.ttl_hours(query) + self.stale_hours
+
+    def all_fresh(self, queries: list[str]) -> bool:
+        """Whether every query has a fresh entry, so a crawl would not touch the network."""
+        return all((meta := self.load_meta(q)) is not None and self.is_fresh(q, meta) for q in queries)
+
+    def expired(self, queries: list[str]) -> dict[str, float | None]:
+        """Age in hours of each query entry past its TTL (None if missing), ignoring ``stale_hours``."""
+        now = time.time()
+        ages = {}
+        for q in queries:
+            meta = self.load_meta(q)
+            age = None if meta is None else (now - meta["timestamp"]) / 3600
+            if age is None or age > self.ttl_hours(q):
+                ages[q] = age
+        return ages
+
+    @staticmethod
+    def validators(meta: dict) -> dict:
+        """Conditional request headers for a cached entry."""
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    @abstractmethod
+    def load_meta(self, query: str) -> dict | None:
+        """Return the query's metadata without reading its records, or None."""
+
+    @abstractmethod
+    def save_meta(self, query: str, meta: dict) -> None:
+        """Replace the query's metadata, keeping its records."""
+
+    @abstractmethod
+    def iter_records(self, query: str) -> Iterator[Skill]:
+        """Yield the query's cached records."""
+
+    @abstractmethod
+    def write_records(self, query: str, records: Iterable[Skill], meta: dict) -> Iterator[Skill]:
+        """Pass ``records`` through while storing them as the query's entry.
+
+        The entry is replaced only once the records are exhausted, so a failed
+        fetch leaves the previous entry intact.
+        """
+
+    def load_catalog(self, queries: list[str]) -> list[Skill] | None:
+        """Return the merged catalog if every query is cached, fresh and unchanged since it was built."""
+        return None
 
-def _load_cache() -> list[dict] | None:
-    """Load skills from cache if it exists and is fresh."""
-    if not CACHE_FILE.exists():
+    def save_catalog(self, queries: list[str], skills: list[Skill]) -> None:
+        """Store the merged catalog, in no particular order, for the load_catalog fast path."""
+
+    def load_crawl(self) -> float | None:
+        """Start time of an unfinished crawl, if a previous run died mid-crawl."""
         return None
-    try:
-        data = json.loads(CACHE_FILE.read_text())
-        age_hours = (time.time() - data["timestamp"]) / 3600
-        if age_hours > CACHE_MAX_AGE_HOURS:
-            print(f"Cache expired ({age_hours:.1f}h old, max {CACHE_MAX_AGE_HOURS}h). Re-fetching...")
+
+    def save_crawl(self, started_at: float | None) -> None:
+        """Record a crawl's start time, or clear it (None) once every query succeeded."""
+
+    @contextlib.contextmanager
+    def fetch_lock(self) -> Iterator[bool]:
+        """Hold the cache's cross-process fetch lock; yield whether another process held it first.
+
+        Without ``fcntl`` (Windows) there is no cross-process lock, and runs
+        simply do not coordinate.
+        """
+        if fcntl is None:
+            yield False
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_dir / "fetch.lock", "a") as f:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                waited = False
+            except BlockingIOError:
+                print("Another run is fetching into this cache; waiting for its results...")
+                fcntl.flock(f, fcntl.LOCK_EX)
+                waited = True
+            try:
+                yield waited
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def set_outcome(self, query: str, outcome: str) -> None:
+        with self._lock:
+            self.outcomes[query] = outcome
+
+    def summary(self) -> str:
+        """One-line hit/revalidated/miss counts and the TTLs in effect."""
+        counts = {k: 0 for k in ("hit", "revalidated", "miss")}
+        for outcome in self.outcomes.values():
+            counts[outcome] += 1
+        ttls = f"TTL {self.max_age_hours:g}h"
+        if self.query_max_age_hours:
+            ttls += ", " + ", ".join(f"q={q} {h:g}h" for q, h in sorted(self.query_max_age_hours.items()))
+        return (
+            f"Query cache: {counts['hit']} hit, {counts['revalidated']} revalidated, "
+            f"{counts['miss']} miss ({ttls})"
+        )
+
+
+class _JsonQueryCache(_QueryCache):
+    """Query cache as NDJSON record files plus JSON metadata under CACHE_DIR/queries."""
+
+    def __init__(self, root: Path | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self.root = root or self.cache_dir / "queries"
+
+    def _path(self, query: str, suffix: str) -> Path:
+        return self.root / f"{urllib.parse.quote(query, safe='')}{suffix}"
+
+    def load_meta(self, query: str) -> dict | None:
+        try:
+            meta = json.loads(self._path(query, ".meta.json").read_text())
+        except (OSError, json.JSONDecodeError):
             return None
-        print(f"Using cached data ({age_hours:.0f}m old, {len(data['skills']):,} skills)")
-        return data["skills"]
-    except (json.JSONDecodeError, KeyError):
-        return None
+        if "timestamp" not in meta or not self._path(query, ".ndjson").exists():
+            return None
+        return meta
 
+    def save_meta(self, query: str, meta: dict) -> None:
+        _write_atomic(self._path(query, ".meta.json"), json.dumps(meta))
 
-def _save_cache(skills: list[dict]) -> None:
-    """Save skills to cache."""
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    CACHE_FILE.write_text(json.dumps({"timestamp": time.time(), "skills": skills}))
-    print(f"Cached to {CACHE_FILE}")
+    def iter_records(self, query: str) -> Iterator[Skill]:
+        with open(self._path(query, ".ndjson")) as f:
+            for line in f:
+                yield Skill.from_api(json.loads(line))
 
+    def write_records(self, query: str, records: Iterable[Skill], meta: dict) -> Iterator[Skill]:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(query, ".ndjson")
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, "w") as f:
+                for record in records:
+                    f.write(json.dumps(record.to_dict(), separators=(",", ":")))
+                    f.write("\n")
+                    yield record
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        self.save_meta(query, meta)
+
+    def load_crawl(self) -> float | None:
+        try:
+            return json.loads((self.root / "crawl.json").read_text())["started_at"]
+        except (OSError, json.JSONDecodeError, KeyError):
+            return None
 
-def _fetch_from_api() -> list[dict]:
-    """Fetch all skills from skills.sh via the search API."""
-    all_skills: dict[str, dict] = {}
-    print("Fetching skills from skills.sh API...")
+    def save_crawl(self, started_at: float | None) -> None:
+        path = self.root / "crawl.json"
+        if started_at is None:
+            path.unlink(missing_ok=True)
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        _write_atomic(path, json.dumps({"started_at": started_at}))
+
+
+class _SqliteQueryCache(_QueryCache):
+    """Query cache in a single SQLite database (CACHE_DIR/cache.sqlite3).
+
+    Metadata lives in its own small table, records keep only the columns the
+    dashboard uses, and every write is one transaction. A merged ``catalog``
+    table lets a fully fresh cache load with one query.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS queries (
+            query TEXT PRIMARY KEY,
+            timestamp REAL NOT NULL,
+            changed_at REAL NOT NULL,
+            etag TEXT,
+            last_modified TEXT
+        );
+        CREATE TABLE IF NOT EXISTS records (
+            query TEXT NOT NULL,
+            id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            source TEXT NOT NULL,
+            installs INTEGER NOT NULL,
+            PRIMARY KEY (query, id)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS catalog (
+            id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            source TEXT NOT NULL,
+            installs INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+    """
+
+    def __init__(self, path: Path | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path or self.cache_dir / "cache.sqlite3"
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._ready:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=60)
+        if not self._ready:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.SCHEMA)
+            self._ready = True
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def load_meta(self, query: str) -> dict | None:
+        with contextlib.closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT timestamp, etag, last_modified FROM queries WHERE query = ?", (query,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"timestamp": row[0], "etag": row[1], "last_modified": row[2]}
+
+    def save_meta(self, query: str, meta: dict) -> None:
+        with contextlib.closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE queries SET timestamp = ?, etag = ?, last_modified = ? WHERE query = ?",
+                (meta["timestamp"], meta.get("etag"), meta.get("last_modified"), query),
+            )
+
+    def iter_records(self, query: str) -> Iterator[Skill]:
+        with contextlib.closing(self._connect()) as conn:
+            rows = conn.execute("SELECT id, name, source, installs FROM records WHERE query = ?", (query,))
+            for id, name, source, installs in rows:
+                yield Skill(id, name or id[len(source) + 1:], source, installs)
+
+    def write_records(self, query: str, records: Iterable[Skill], meta: dict) -> Iterator[Skill]:
+        # Rows are buffered and written in one short transaction, so concurrent
+        # fetches do not hold the database write lock while they wait on the
+        # network. A row references the Skill's own id and source strings, and a
+        # name that is just the tail of the id is stored as "" (see Skill) rather
+        # than sliced out, so the buffer copies no strings.
+        rows = []
+        for r in records:
+            rows.append((query, r.id, r._name or "", r.source, r.installs))
+            yield r
+        with contextlib.closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM records WHERE query = ?", (query,))
+            conn.executemany("INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?)", rows)
+            conn.execute(
+                "INSERT OR REPLACE INTO queries VALUES (?, ?, ?, ?, ?)",
+                (query, meta["timestamp"], meta["timestamp"], meta.get("etag"), meta.get("last_modified")),
+            )
+
+    def load_catalog(self, queries: list[str]) -> list[Skill] | None:
+        with contextlib.closing(self._connect()) as conn:
+            settings = dict(conn.execute("SELECT key, value FROM settings"))
+            if settings.get("catalog_queries") != json.dumps(queries):
+                return None
+            entries = {q: (ts, changed) for q, ts, changed in conn.execute(
+                "SELECT query, timestamp, changed_at FROM queries"
+            )}
+            if any(q not in entries or not self.is_fresh(q, {"timestamp": entries[q][0]}) for q in queries):
+                return None
+            if max(changed for _, changed in entries.values()) > float(settings["catalog_built_at"]):
+                return None
+            rows = conn.execute("SELECT id, name, source, installs FROM catalog ORDER BY rowid").fetchall()
+        return [Skill(*row) for row in rows]
+
+    def save_catalog(self, queries: list[str], skills: list[Skill]) -> None:
+        with contextlib.closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM catalog")
+            conn.executemany(
+                "INSERT INTO catalog VALUES (?, ?, ?, ?)",
+                ((s.id, s.name, s.source, s.installs) for s in skills),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO settings VALUES (?, ?)",
+                [("catalog_queries", json.dumps(queries)), ("catalog_built_at", repr(time.time()))],
+            )
+
+    def load_crawl(self) -> float | None:
+        with contextlib.closing(self._connect()) as conn:
+            row = conn.execute("SELECT value FROM settings WHERE key = 'crawl_started_at'").fetchone()
+        return float(row[0]) if row else None
+
+    def save_crawl(self, started_at: float | None) -> None:
+        with contextlib.closing(self._connect()) as conn, conn:
+            if started_at is None:
+                conn.execute("DELETE FROM settings WHERE key = 'crawl_started_at'")
+            else:
+                conn.execute("INSERT OR REPLACE INTO settings VALUES ('crawl_started_at', ?)", (repr(started_at),))
+
+
+CACHE_BACKENDS = {"sqlite": _SqliteQueryCache, "json": _JsonQueryCache}
+
+
+def _query_records(
+    query: str,
+    client: SkillsClient,
+    cache: _QueryCache,
+    refresh: bool = False,
+    stats: dict | None = None,
+    crawl_started: float | None = None,
+) -> Iterator[Skill]:
+    """Yield a query's records from the cache while fresh, else from the API.
+
+    An entry stored since ``crawl_started`` was checkpointed by the current
+    (possibly interrupted) crawl and is reused even when ``refresh`` is set.
+    """
+    meta = cache.load_meta(query)
+    if meta is not None and (
+        (crawl_started is not None and meta["timestamp"] >= crawl_started)
+        or (not refresh and cache.is_fresh(query, meta))
+    ):
+        cache.set_outcome(query, "hit")
+        yield from cache.iter_records(query)
+        return
+    yield from _fetch_query(query, client=client, cache=cache, meta=meta, stats=stats)
+
+
+class _Catalog:
+    """Thread-safe dedupe map of skills keyed by id.
+
+    A record from a later SEARCH_QUERIES entry replaces an earlier one whatever
+    order the queries finish in, so the result matches a serial scrape. The
+    given aggregators are kept in step with the map as records arrive, so
+    aggregation is finished when the last query is.
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, aggregators: Iterable["Aggregator"] = ()):
+        self.skills: dict[str, Skill] = {}
+        self._rank: dict[str, int] = {}
+        self._aggregators = list(aggregators)
+        self._lock = threading.Lock()
+
+    def merge(self, rank: int, records: Iterable[Skill]) -> int:
+        """Merge one query's records; return how many ids were new."""
+        added = 0
+        records = iter(records)
+        while batch := list(itertools.islice(records, self.BATCH_SIZE)):
+            with self._lock:
+                for s in batch:
+                    prev = self._rank.get(s.id)
+                    old = None
+                    if prev is None:
+                        added += 1
+                    elif prev > rank:
+                        continue
+                    else:
+                        old = self.skills[s.id]
+                    self.skills[s.id] = s
+                    self._rank[s.id] = rank
+                    if old is not None and old.installs == s.installs and old.source == s.source:
+                        continue  # the usual case: the same skill seen by another query
+                    for aggregator in self._aggregators:
+                        if old is not None:
+                            aggregator.remove(old)
+                        aggregator.add(s)
+        return added
+
+
+def _fetch_from_api(
+    concurrency: int = DEFAULT_CONCURRENCY,
+    cache: _QueryCache | None = None,
+    refresh: bool = False,
+    api_base: str | None = None,
+    metrics: RunMetrics | None = None,
+    aggregators: Iterable["Aggregator"] = (),
+) -> list[Skill]:
+    """Fetch all skills from skills.sh via the search API, in no particular order.
+
+    Queries run on a bounded thread pool and stream their records straight into
+    a shared dedupe map, and from there into ``aggregators``; progress lines
+    are printed as each query completes.
+    Fresh per-query cache entries are used instead of the network unless
+    ``refresh`` is set, and stale ones are revalidated.
+
+    Each query's entry is checkpointed as soon as it completes. A failed query
+    does not stop the others; the crawl stays open in the cache and the error
+    is raised at the end, so a rerun within the cache TTL only fetches the
+    queries that are still missing.
+
+    Crawls are single-flight across processes: only the holder of the cache's
+    fetch lock crawls. A run that had to wait for the lock then reuses every
+    entry stored since it started waiting, so concurrent runs cost one scrape.
+    """
+    cache = cache or _SqliteQueryCache()
+    metrics = metrics or RunMetrics()
+    requested_at = time.time()
+    if not refresh:
+        cached = _load_cached_catalog(cache, metrics, aggregators)
+        if cached is not None:
+            return cached
+        if cache.all_fresh(SEARCH_QUERIES):  # merged catalog is out of date; no fetching needed
+            return _crawl(concurrency, cache, refresh, api_base, metrics, aggregators, readonly=True)
+    with cache.fetch_lock() as waited:
+        if waited and not refresh:
+            cached = _load_cached_catalog(cache, metrics, aggregators)
+            if cached is not None:
+                return cached
+        return _crawl(concurrency, cache, refresh, api_base, metrics, aggregators, requested_at if waited else None)
+
+
+def _load_cached_catalog(
+    cache: _QueryCache, metrics: RunMetrics, aggregators: Iterable["Aggregator"]
+) -> list[Skill] | None:
+    """The cache's merged catalog, fed to ``aggregators``, if it is complete and fresh."""
+    with metrics.phase("fetch.catalog_load"):
+        cached = cache.load_catalog(SEARCH_QUERIES)
+    if cached is None:
+        return None
     for q in SEARCH_QUERIES:
-        batch = _fetch_query(q)
-        before = len(all_skills)
-        for s in batch:
-            all_skills[s["id"]] = s
-        added = len(all_skills) - before
-        if added > 0:
-            print(f"  q={q:4s}: +{added:>5,} -> {len(all_skills):>6,} unique skills")
-    skills = sorted(all_skills.values(), key=lambda s: s["installs"], reverse=True)
+        cache.set_outcome(q, "hit")
+        metrics.query(q)["outcome"] = "hit"
+    for aggregator in aggregators:
+        for s in cached:
+            aggregator.add(s)
+    print(f"Using cached catalog ({len(cached):,} skills)")
+    print(cache.summary())
+    return cached
+
+
+def _crawl(
+    concurrency: int,
+    cache: _QueryCache,
+    refresh: bool,
+    api_base: str | None,
+    metrics: RunMetrics,
+    aggregators: Iterable["Aggregator"],
+    fresh_since: float | None = None,
+    readonly: bool = False,
+) -> list[Skill]:
+    """Run (or resume) a crawl of every query; the body of _fetch_from_api.
+
+    Entries stored since ``fresh_since`` (or since an interrupted crawl began)
+    are reused even when ``refresh`` is set. A ``readonly`` crawl only merges
+    fresh cache entries: it runs without the fetch lock, so it leaves the
+    crawl checkpoint and the merged catalog to whoever holds it.
+    """
+    crawl_started = None
+    if not readonly:
+        crawl_started = cache.load_crawl()
+        if crawl_started is not None and (time.time() - crawl_started) / 3600 <= cache.max_age_hours:
+            started = time.strftime("%H:%M:%S", time.localtime(crawl_started))
+            print(f"Resuming interrupted crawl started at {started}")
+        else:
+            crawl_started = fresh_since or time.time()
+            cache.save_crawl(crawl_started)
+    catalog = _Catalog(aggregators)
+    workers = max(1, min(concurrency, len(SEARCH_QUERIES)))
+    api_base = api_base or API_BASE
+    source = "skills.sh API" if api_base == DEFAULT_API_BASE else api_base
+    print(f"Fetching skills from {source} ({workers} concurrent queries)...")
+    client = SkillsClient(api_base, max_idle=workers)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(
+                    catalog.merge, rank, _query_records(q, client, cache, refresh, metrics.query(q), crawl_started)
+                ): q
+                for rank, q in enumerate(SEARCH_QUERIES)
+            }
+            failures = {}
+            try:
+                for future in as_completed(futures):
+                    q = futures[future]
+                    try:
+                        added = future.result()
+                    except Exception as e:
+                        failures[q] = e
+                        print(f"  q={q:4s}: failed ({e})")
+                        continue
+                    stats = metrics.query(q)
+                    stats["new_unique"] = added
+                    stats["outcome"] = cache.outcomes.get(q, "miss")
+                    if added > 0:
+                        print(
+                            f"  q={q:4s}: +{added:>5,} -> {len(catalog.skills):>6,} unique skills"
+                            f" ({cache.outcomes.get(q, 'miss')})"
+                        )
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+    finally:
+        client.close()
+    if failures:
+        done = len(SEARCH_QUERIES) - len(failures)
+        raise RuntimeError(
+            f"{len(failures)} of {len(SEARCH_QUERIES)} queries failed ({', '.join(sorted(failures))}); "
+            f"the other {done} are checkpointed, rerun to fetch only the missing ones"
+        ) from next(iter(failures.values()))
+    skills = list(catalog.skills.values())
     print(f"Total: {len(skills):,} unique skills")
+    print(cache.summary())
+    if not readonly:
+        cache.save_crawl(None)
+        with metrics.phase("fetch.catalog_save"):
+            cache.save_catalog(SEARCH_QUERIES, skills)
     return skills
 
 
-def fetch_skills(no_cache: bool = False) -> list[dict]:
-    """Fetch all skills, using cache unless --no-cache is set."""
-    if not no_cache:
-        cached = _load_cache()
-        if cached is not None:
-            return cached
-    skills = _fetch_from_api()
-    _save_cache(skills)
+def fetch_skills(
+    no_cache: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_age_hours: float = CACHE_MAX_AGE_HOURS,
+    query_max_age_hours: dict[str, float] | None = None,
+    cache_backend: str = "sqlite",
+    api_base: str | None = None,
+    metrics: RunMetrics | None = None,
+    aggregators: Iterable["Aggregator"] = (),
+    stale_hours: float = 0,
+) -> list[Skill]:
+    """Fetch all skills, reusing per-query cache entries unless --no-cache is set.
+
+    ``aggregators`` are fed while the fetch runs; see _fetch_from_api.
+
+    With ``no_cache`` every query goes to the API, but cached validators are
+    still sent so unchanged queries come back as 304s.
+
+    With ``stale_hours`` (stale-while-revalidate), entries up to that long past
+    their TTL are returned as they are, and a detached background process
+    refreshes them for the next caller. Entries older than TTL + ``stale_hours``
+    are still fetched before returning.
+    """
+    api_base = api_base or API_BASE
+    cache = CACHE_BACKENDS[cache_backend](
+        max_age_hours=max_age_hours,
+        query_max_age_hours=query_max_age_hours,
+        cache_dir=_cache_dir(api_base),
+        stale_hours=0 if no_cache else stale_hours,
+    )
+    expired = cache.expired(SEARCH_QUERIES) if cache.stale_hours else {}
+    metrics = metrics or RunMetrics()
+    skills = _fetch_from_api(
+        concurrency=concurrency,
+        cache=cache,
+        refresh=no_cache,
+        api_base=api_base,
+        metrics=metrics,
+        aggregators=aggregators,
+    )
+    stale = {q: age for q, age in expired.items() if cache.outcomes.get(q) == "hit"}
+    if stale:
+        for q in stale:
+            metrics.query(q)["outcome"] = "stale"
+        log = _spawn_refresh(cache, cache_backend, concurrency, api_base)
+        oldest = max(stale.values())
+        age = f"{oldest:.1f}h" if oldest >= 1 else f"{oldest * 60:.0f}m"
+        print(f"Served {len(stale)} stale queries (oldest {age}); refreshing them in the background (log: {log})")
     return skills
 
 
-def aggregate(skills: list[dict]) -> list[dict]:
-    """Aggregate skills by owner (GitHub org/user)."""
-    owners = defaultdict(lambda: {"count": 0, "total_installs": 0, "skills": [], "repos": set()})
-    for s in skills:
-        owner = s["source"].split("/")[0]
-        owners[owner]["count"] += 1
-        owners[owner]["total_installs"] += s["installs"]
-        owners[owner]["skills"].append(
-            {"name": s["name"], "installs": s["installs"], "repo": s["source"]}
-        )
-        owners[owner]["repos"].add(s["source"])
-
-    result = []
-    for owner, data in sorted(owners.items(), key=lambda x: x[1]["total_installs"], reverse=True):
-        result.append(
-            {
-                "owner": owner,
-                "count": data["count"],
-                "total_installs": data["total_installs"],
-                "repos": len(data["repos"]),
-                "skills": sorted(data["skills"], key=lambda x: x["installs"], reverse=True),
-            }
+def _spawn_refresh(cache: _QueryCache, cache_backend: str, concurrency: int, api_base: str) -> Path:
+    """Start a detached ``--refresh-cache`` run of this script; return its log path.
+
+    The child holds the cache's fetch lock while it crawls, so overlapping
+    refreshes cost one scrape.
+    """
+    command = [
+        sys.executable, os.path.abspath(__file__), "--refresh-cache",
+        "--api-base", api_base,
+        "--cache-backend", cache_backend,
+        "--cache-ttl", repr(cache.max_age_hours),
+        "--concurrency", str(concurrency),
+    ]
+    for query, hours in cache.query_max_age_hours.items():
+        command += ["--query-ttl", f"{query}={hours!r}"]
+    log = cache.cache_dir / "refresh.log"
+    log.parent.mkdir(parents=True, exist_ok=True)
+    with open(log, "ab") as out:
+        subprocess.Popen(
+            command, stdin=subprocess.DEVNULL, stdout=out, stderr=subprocess.STDOUT,
+            start_new_session=True, close_fds=True,
         )
-    return result
+    return log
+
+
+def _cache_dir(api_base: str) -> Path:
+    """Cache directory for an API base; non-default servers get their own namespace."""
+    if api_base == DEFAULT_API_BASE:
+        return CACHE_DIR
+    return CACHE_DIR / f"api-{hashlib.sha1(api_base.encode()).hexdigest()[:12]}"
+
+
+HISTORY_MAGIC = b"SKHIST1\n"
+
+
+def _append_varint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(buf: bytes, pos: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if b < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _zigzag(n: int) -> int:
+    return n * 2 if n >= 0 else -n * 2 - 1
+
+
+def _unzigzag(z: int) -> int:
+    return z >> 1 if not z & 1 else -(z >> 1) - 1
+
+
+class SnapshotStore:
+    """Append-only history of per-skill install counts, one snapshot per scrape.
+
+    The file is HISTORY_MAGIC followed by records:
+
+    - ``K`` varint(len) id: registers the next integer key for a skill id.
+    - ``S`` varint(day ordinal) varint(n), then n pairs of varint(key gap) and
+      zigzag varint(install delta) for the skills whose installs changed since
+      the previous snapshot. A skill missing from a scrape drops to 0.
+
+    A scrape in which no installs changed and no skill is new is not recorded,
+    so an unchanged catalog leaves the file untouched.
+
+    Unchanged skills cost nothing and most deltas fit in a byte or two, so a
+    daily snapshot of the full catalog adds only kilobytes. Loading decodes the
+    file once into sorted key/delta arrays; series queries then bisect them.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.ids: list[str] = []
+        self.days: list[date] = []
+        self._keys: dict[str, int] = {}
+        self._born: list[int] = []  # number of snapshots before each key existed
+        self._changes: list[tuple[array, array]] = []
+        self._current = array("q")
+        self._owners: dict[str, list[int]] | None = None
+        self._size = 0
+        if self.path.exists():
+            self._load()
+
+    def _register(self, skill_id: str) -> int:
+        key = len(self.ids)
+        self.ids.append(skill_id)
+        self._keys[skill_id] = key
+        self._born.append(len(self.days))
+        self._current.append(0)
+        self._owners = None
+        return key
+
+    def _load(self) -> None:
+        buf = self.path.read_bytes()
+        if not buf.startswith(HISTORY_MAGIC):
+            raise ValueError(f"{self.path} is not a skills history file")
+        pos = self._size = len(HISTORY_MAGIC)
+        while pos < len(buf):
+            try:
+                tag, pos = buf[pos], pos + 1
+                if tag == ord("K"):
+                    n, pos = _read_varint(buf, pos)
+                    if pos + n > len(buf):
+                        raise IndexError
+                    self._register(buf[pos:pos + n].decode("utf-8"))
+                    pos += n
+                elif tag == ord("S"):
+                    day, pos = _read_varint(buf, pos)
+                    n, pos = _read_varint(buf, pos)
+                    keys, deltas, key = array("q"), array("q"), -1
+                    for _ in range(n):
+                        gap, pos = _read_varint(buf, pos)
+                        z, pos = _read_varint(buf, pos)
+                        key += gap + 1
+                        keys.append(key)
+                        deltas.append(_unzigzag(z))
+                    for key, delta in zip(keys, deltas):
+                        self._current[key] += delta
+                    self.days.append(date.fromordinal(day))
+                    self._changes.append((keys, deltas))
+                else:
+                    raise ValueError(f"{self.path}: unknown record tag {tag!r} at byte {pos - 1}")
+            except IndexError:
+                # A torn final record from an interrupted append; the next append overwrites it.
+                print(f"Warning: ignoring truncated record at byte {self._size} of {self.path}")
+                return
+            self._size = pos
+
+    def append(self, skills: Iterable[Skill], day: date | None = None) -> int:
+        """Record one snapshot of ``skills``; return the number of bytes appended (0 if unchanged)."""
+        day = day or date.today()
+        known = len(self.ids)
+        out = bytearray(HISTORY_MAGIC if self._size == 0 else b"")
+        present = bytearray(len(self.ids))
+        changes = []
+        for s in skills:
+            key = self._keys.get(s.id)
+            if key is None:
+                key = self._register(s.id)
+                present.append(0)
+                encoded = s.id.encode("utf-8")
+                out += b"K"
+                _append_varint(out, len(encoded))
+                out += encoded
+            present[key] = 1
+            if s.installs != self._current[key]:
+                changes.append((key, s.installs - self._current[key]))
+        for key, flag in enumerate(present):
+            if not flag and self._current[key]:
+                changes.append((key, -self._current[key]))
+        if not changes and len(self.ids) == known and self._size:
+            return 0
+        changes.sort()
+
+        out += b"S"
+        _append_varint(out, day.toordinal())
+        _append_varint(out, len(changes))
+        keys, deltas, prev = array("q"), array("q"), -1
+        for key, delta in changes:
+            _append_varint(out, key - prev - 1)
+            _append_varint(out, _zigzag(delta))
+            keys.append(key)
+            deltas.append(delta)
+            self._current[key] += delta
+            prev = key
+        self.days.append(day)
+        self._changes.append((keys, deltas))
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "r+b" if self.path.exists() else "wb") as f:
+            f.seek(self._size)
+            f.truncate()
+            f.write(out)
+        self._size += len(out)
+        return len(out)
+
+    def skill_series(self, skill_id: str) -> list[tuple[date, int]]:
+        """Installs of one skill at every snapshot since it first appeared."""
+        key = self._keys.get(skill_id)
+        return [] if key is None else self._series([key])
+
+    def owner_series(self, owner: str) -> list[tuple[date, int]]:
+        """Total installs across an owner's skills at every snapshot."""
+        if self._owners is None:
+            self._owners = defaultdict(list)
+            for key, skill_id in enumerate(self.ids):
+                self._owners[skill_id.split("/")[0]].append(key)
+        return self._series(self._owners.get(owner, []))
+
+    def _series(self, keys: list[int]) -> list[tuple[date, int]]:
+        if not keys:
+            return []
+        start = min(self._born[k] for k in keys)
+        value = 0
+        series: list[tuple[date, int]] = []
+        for i, (day, (changed, deltas)) in enumerate(zip(self.days, self._changes)):
+            for key in keys:
+                j = bisect.bisect_left(changed, key)
+                if j < len(changed) and changed[j] == key:
+                    value += deltas[j]
+            if i < start:
+                continue
+            if series and series[-1][0] == day:
+                series[-1] = (day, value)  # several scrapes on one day: keep the last
+            else:
+                series.append((day, value))
+        return series
+
+
+GROUP_LABELS = {"owner": "publishers", "repo": "repos"}
+# How many groups and skills are ranked by default: enough for the dashboard's
+# top-50 treemap and top-25/30 bar charts.
+DEFAULT_TOP_K = 50
+# Treemap level of detail: skills shown per owner before the rest roll up into
+# an "other" node, and the budget for all data embedded in the page.
+DEFAULT_MAX_CHILDREN = 100
+DEFAULT_MAX_PAYLOAD_KB = 512
+# Budget for the skill/publisher search index the page loads on first use; the
+# least-installed skills are left out until it fits.
+DEFAULT_SEARCH_INDEX_KB = 512
+SEARCH_GRAM = 3
+# Plotly bundle the page loads by default. --plotly-js swaps in a local (e.g.
+# partial bar+treemap) bundle that is copied next to the page.
+PLOTLY_CDN_URL = "https://cdn.plot.ly/plotly-2.35.0.min.js"
+# "lazy" draws each chart when it nears the viewport; "eager" draws all on load.
+CHART_LOADING_MODES = ("lazy", "eager")
+# Install histogram bins are fixed-width in log10(installs): 8 per decade.
+HISTOGRAM_BIN_WIDTH = 0.125
+
+
+# Relative accuracy of the install quantile sketches.
+SKETCH_ACCURACY = 0.01
+STAT_QUANTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99, "p99_9": 0.999}
+# Fewest values at or above x_min for a power-law fit to be considered.
+POWER_LAW_MIN_TAIL = 50
+# Bucket indexes of values below this are looked up instead of computed with a log.
+SKETCH_TABLE_SIZE = 4096
+_sketch_tables: dict[float, list[int]] = {}
+
+
+class QuantileSketch:
+    """Mergeable streaming quantile sketch (DDSketch) over non-negative values.
+
+    Positive values fall into logarithmic buckets whose bounds grow by a factor
+    gamma = (1 + a) / (1 - a), so every quantile is within relative accuracy
+    ``a``. Memory depends on the value range, not the count: about 800 buckets
+    cover 1 to 10M installs at 1%. Each bucket also keeps the exact sum of its
+    values, which the concentration metrics in stats() use. Values can be
+    removed again, and sketches with the same accuracy can be merged.
+    """
+
+    __slots__ = ("accuracy", "_log_gamma", "_table", "zeros", "count", "total", "_buckets")
+
+    def __init__(self, accuracy: float = SKETCH_ACCURACY):
+        self.accuracy = accuracy
+        self._log_gamma = math.log((1 + accuracy) / (1 - accuracy))
+        self._table = _sketch_tables.get(accuracy)
+        if self._table is None:
+            self._table = _sketch_tables[accuracy] = [0] + [
+                math.ceil(math.log(v) / self._log_gamma) for v in range(1, SKETCH_TABLE_SIZE)
+            ]
+        self.zeros = 0
+        self.count = 0
+        self.total = 0
+        self._buckets: dict[int, list] = {}  # bucket index -> [count, sum of values]
+
+    def _index(self, value: int) -> int:
+        if value < SKETCH_TABLE_SIZE:
+            return self._table[value]
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def add(self, value: int) -> None:
+        self.count += 1
+        self.total += value
+        if value <= 0:
+            self.zeros += 1
+            return
+        i = self._table[value] if value < SKETCH_TABLE_SIZE else self._index(value)
+        bucket = self._buckets.get(i)
+        if bucket is None:
+            bucket = self._buckets[i] = [0, 0]
+        bucket[0] += 1
+        bucket[1] += value
+
+    def remove(self, value: int) -> None:
+        """Undo an earlier add() of ``value``."""
+        self.count -= 1
+        self.total -= value
+        if value <= 0:
+            self.zeros -= 1
+            return
+        i = self._index(value)
+        bucket = self._buckets[i]
+        bucket[0] -= 1
+        bucket[1] -= value
+        if not bucket[0]:
+            del self._buckets[i]
+
+    def replace(self, old: int, new: int) -> None:
+        """remove(old) then add(new), cheaply when both land in the same bucket."""
+        if old > 0 and new > 0:
+            i = self._index(old)
+            if i == self._index(new):
+                self._buckets[i][1] += new - old
+                self.total += new - old
+                return
+        self.remove(old)
+        self.add(new)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add every value of ``other``, e.g. a sketch built over another shard."""
+        if other.accuracy != self.accuracy:
+            raise ValueError(f"cannot merge sketches with accuracy {self.accuracy} and {other.accuracy}")
+        self.zeros += other.zeros
+        self.count += other.count
+        self.total += other.total
+        for i, (count, total) in other._buckets.items():
+            bucket = self._buckets.setdefault(i, [0, 0])
+            bucket[0] += count
+            bucket[1] += total
+
+    def _value(self, i: int) -> float:
+        """Representative value of bucket ``i``, within the relative accuracy of all its values."""
+        return 2 * math.exp(i * self._log_gamma) / (1 + math.exp(self._log_gamma))
+
+    def _ascending(self) -> list[tuple[float, int, int]]:
+        """(representative value, count, sum) per bucket, smallest first, zeros included."""
+        rows = [(0.0, self.zeros, 0)] if self.zeros else []
+        return rows + [(self._value(i), *self._buckets[i]) for i in sorted(self._buckets)]
+
+    def quantile(self, q: float) -> float | None:
+        """The ``q``-quantile (0 <= q <= 1), or None when the sketch is empty."""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for value, count, _ in self._ascending():
+            seen += count
+            if seen > rank:
+                return value
+        return value
+
+    def stats(self) -> dict:
+        """Count, STAT_QUANTILES, Gini, top 1% / 10% shares and a power-law fit.
+
+        Shares and the Gini coefficient come from the exact bucket sums, so the
+        only approximation is treating the values inside one bucket as equal.
+        The power-law exponent is the discrete maximum-likelihood estimate over
+        values >= x_min, with x_min chosen to minimize the Kolmogorov-Smirnov
+        distance (Clauset, Shalizi & Newman 2009).
+        """
+        rows = self._ascending()
+        stats = {"count": self.count, "total": self.total}
+        stats.update({name: self.quantile(q) for name, q in STAT_QUANTILES.items()})
+        gini = top1 = top10 = None
+        if self.count and self.total:
+            lorenz, people, income = 0.0, 0, 0
+            for _, count, total in rows:
+                lorenz += count * (2 * income + total)
+                people += count
+                income += total
+            gini = 1 - lorenz / (self.count * self.total)
+            top1, top10 = self._top_share(rows, 0.01), self._top_share(rows, 0.1)
+        stats.update({"gini": gini, "top1_share": top1, "top10_share": top10})
+        stats.update(self._power_law(rows))
+        return stats
+
+    def _top_share(self, rows: list[tuple[float, int, int]], fraction: float) -> float:
+        """Share of the total held by the largest ``fraction`` of values."""
+        want, held = fraction * self.count, 0.0
+        for _, count, total in reversed(rows):
+            take = min(count, want)
+            held += total * take / count
+            want -= take
+            if want <= 0:
+                break
+        return held / self.total
+
+    def _power_law(self, rows: list[tuple[float, int, int]]) -> dict:
+        best = {"alpha": None, "x_min": None, "ks": None}
+        rows = [row for row in rows if row[0] > 0]
+        tail, tail_logs = 0, 0.0
+        suffix = []  # (x_min, tail count, sum of log(x) over the tail), largest x_min first
+        for value, count, _ in reversed(rows):
+            tail += count
+            tail_logs += count * math.log(value)
+            suffix.append((value, tail, tail_logs))
+        for start, (x_min, n, logs) in enumerate(reversed(suffix)):
+            if n < POWER_LAW_MIN_TAIL:
+                break
+            shift = x_min - 0.5  # discrete approximation for integer counts
+            denominator = logs - n * math.log(shift)
+            if denominator <= 0:
+                continue
+            alpha = 1 + n / denominator
+            ks, seen = 0.0, 0
+            for value, count, _ in rows[start:]:
+                seen += count
+                model = 1 - ((value + 0.5) / shift) ** (1 - alpha)
+                ks = max(ks, abs(seen / n - model))
+            if best["ks"] is None or ks < best["ks"]:
+                best = {"alpha": alpha, "x_min": round(x_min), "ks": ks}
+        return best
+
+
+def _rank_key(skill: Skill) -> tuple:
+    """Sort key for ranking skills: most installs first, ties broken by id."""
+    return -skill.installs, skill.id
+
+
+def _top(k: int | None, items: Iterable, key) -> list:
+    """The ``k`` smallest items by ``key``, in order; all of them if ``k`` is None."""
+    return sorted(items, key=key) if k is None else heapq.nsmallest(k, items, key=key)
+
+
+class Aggregator:
+    """Incremental aggregation of skills by owner (GitHub org/user) or repo.
+
+    add() and remove() update a group's skill count, install total and repo
+    counts in O(1), so the aggregate can follow a catalog while it is being
+    fetched. Quantile sketches of skill installs and of group install totals
+    are updated the same way. result() then ranks groups and skills with
+    bounded heaps, so only the top k entries of each ranking are ever sorted.
+    """
+
+    def __init__(self, group_by: str = "owner"):
+        if group_by not in GROUP_LABELS:
+            raise ValueError(f"group_by must be one of {sorted(GROUP_LABELS)}, got {group_by!r}")
+        self.group_by = group_by
+        self.total_skills = 0
+        self.total_installs = 0
+        self._groups: dict[str, list] = {}  # group -> [count, total_installs, {repo: skills}]
+        self._bins: dict[int, int] = defaultdict(int)  # log10 histogram bin -> skills
+        self.skill_sketch = QuantileSketch()
+        self.group_sketch = QuantileSketch()  # each group's current install total
+
+    def _key(self, skill: Skill) -> str:
+        return skill.owner if self.group_by == "owner" else skill.source
+
+    def add(self, skill: Skill) -> None:
+        group = self._groups.get(self._key(skill))
+        if group is None:
+            group = self._groups[self._key(skill)] = [0, 0, defaultdict(int)]
+            self.group_sketch.add(skill.installs)
+        else:
+            self.group_sketch.replace(group[1], group[1] + skill.installs)
+        group[0] += 1
+        group[1] += skill.installs
+        self.skill_sketch.add(skill.installs)
+        group[2][skill.source] += 1
+        self.total_skills += 1
+        self.total_installs += skill.installs
+        if skill.installs > 0:
+            self._bins[int(math.log10(skill.installs) / HISTOGRAM_BIN_WIDTH)] += 1
+
+    def remove(self, skill: Skill) -> None:
+        """Undo an earlier add() of ``skill``, e.g. when a newer record replaces it."""
+        key = self._key(skill)
+        group = self._groups[key]
+        self.skill_sketch.remove(skill.installs)
+        if group[0] == 1:
+            self.group_sketch.remove(group[1])
+        else:
+            self.group_sketch.replace(group[1], group[1] - skill.installs)
+        group[0] -= 1
+        group[1] -= skill.installs
+        repos = group[2]
+        repos[skill.source] -= 1
+        if not repos[skill.source]:
+            del repos[skill.source]
+        if not group[0]:
+            del self._groups[key]
+        self.total_skills -= 1
+        self.total_installs -= skill.installs
+        if skill.installs > 0:
+            b = int(math.log10(skill.installs) / HISTOGRAM_BIN_WIDTH)
+            self._bins[b] -= 1
+            if not self._bins[b]:
+                del self._bins[b]
+
+    def totals(self) -> dict[str, tuple[int, int]]:
+        """Skill count and install total of every group."""
+        return {g: (group[0], group[1]) for g, group in self._groups.items()}
+
+    def histogram(self) -> dict:
+        """Log-scale install histogram: bin width and start in log10 units, plus counts.
+
+        Skills with 0 installs have no log and are left out, as Plotly did when
+        it binned the raw values client-side.
+        """
+        if not self._bins:
+            return {"bin_width": HISTOGRAM_BIN_WIDTH, "start": 0.0, "counts": []}
+        lo, hi = min(self._bins), max(self._bins)
+        return {
+            "bin_width": HISTOGRAM_BIN_WIDTH,
+            "start": lo * HISTOGRAM_BIN_WIDTH,
+            "counts": [self._bins.get(b, 0) for b in range(lo, hi + 1)],
+        }
+
+    def result(
+        self, skills: Iterable[Skill], top_k: int | None = DEFAULT_TOP_K, skills_per_group: int | None = None
+    ) -> dict:
+        """Rank groups by installs and by skill count, keeping the top ``top_k`` of each.
+
+        ``skills`` must be the records currently added, in any order; it is
+        walked to collect the overall top skills and the top ``skills_per_group``
+        skills of each group ranked by installs. ``None`` means no limit. Skills
+        with equal installs are ordered by id.
+        """
+        groups = self._groups
+
+        def ranked(field: int) -> list[str]:
+            return _top(top_k, groups, lambda g: (-groups[g][field], g))
+
+        by_installs = ranked(1)
+        by_count = ranked(0)
+        entries = {g: self._entry(g) for g in {*by_installs, *by_count}}
+        self._attach_skills([entries[g] for g in by_installs], skills, skills_per_group)
+
+        return {
+            "group_by": self.group_by,
+            "total_skills": self.total_skills,
+            "total_groups": len(groups),
+            "total_repos": sum(len(g[2]) for g in groups.values()),
+            "total_installs": self.total_installs,
+            "histogram": self.histogram(),
+            "stats": {"skills": self.skill_sketch.stats(), "groups": self.group_sketch.stats()},
+            "top_skills": [s.to_dict() for s in _top(top_k, skills, _rank_key)],
+            "by_installs": [entries[g] for g in by_installs],
+            "by_count": [entries[g] for g in by_count],
+        }
+
+    def groups(self, skills: Iterable[Skill] | None = None, skills_per_group: int | None = None) -> list[dict]:
+        """Every group ranked by installs, as in result()["by_installs"].
+
+        For exports, which need neither the overall top skills, the ranking by
+        count nor the stats. Each entry lists its top ``skills_per_group``
+        skills only if ``skills`` (the records currently added) is given.
+        """
+        groups = self._groups
+        entries = [self._entry(g) for g in sorted(groups, key=lambda g: (-groups[g][1], g))]
+        if skills is not None:
+            self._attach_skills(entries, skills, skills_per_group)
+        return entries
+
+    def _entry(self, g: str) -> dict:
+        count, installs, repos = self._groups[g]
+        return {self.group_by: g, "count": count, "total_installs": installs, "repos": len(repos)}
+
+    def _attach_skills(self, entries: list[dict], skills: Iterable[Skill], skills_per_group: int | None) -> None:
+        """Set each entry's "skills" to its top ``skills_per_group`` members, in one walk of ``skills``."""
+        members: dict[str, list] = {e[self.group_by]: [] for e in entries}
+        for s in skills:
+            group = members.get(self._key(s))
+            if group is not None:
+                group.append(s)
+        for e in entries:
+            e["skills"] = [
+                {"name": s.name, "installs": s.installs, "repo": s.source}
+                for s in _top(skills_per_group, members[e[self.group_by]], _rank_key)
+            ]
+
+
+def aggregate(
+    skills: list[Skill],
+    group_by: str = "owner",
+    top_k: int | None = DEFAULT_TOP_K,
+    skills_per_group: int | None = None,
+) -> dict:
+    """Aggregate skills by owner or repo; see Aggregator.result for the shape."""
+    aggregator = Aggregator(group_by)
+    for s in skills:
+        aggregator.add(s)
+    return aggregator.result(skills, top_k=top_k, skills_per_group=skills_per_group)
 
 
-def print_summary(skills: list[dict], owners: list[dict]):
+def print_summary(agg: dict):
     """Print a text summary to stdout."""
-    total_installs = sum(s["installs"] for s in skills)
+    label = GROUP_LABELS[agg["group_by"]]
+    key = agg["group_by"]
     print(f"\n{'='*60}")
-    print(f"  Skills: {len(skills)}  |  Publishers: {len(owners)}  |  Installs: {total_installs:,}")
+    print(
+        f"  Skills: {agg['total_skills']}  |  {label.capitalize()}: {agg['total_groups']}"
+        f"  |  Installs: {agg['total_installs']:,}"
+    )
     print(f"{'='*60}")
-    print("\nTop 10 publishers by installs:")
-    for o in owners[:10]:
-        print(f"  {o['total_installs']:>10,}  {o['count']:3d} skills  {o['owner']}")
-    print(f"\nTop 10 publishers by skill count:")
-    for o in sorted(owners, key=lambda x: x["count"], reverse=True)[:10]:
-        print(f"  {o['count']:3d} skills  {o['total_installs']:>10,} installs  {o['owner']}")
-
-
-def build_html(skills: list[dict], owners: list[dict]) -> str:
-    """Generate the self-contained HTML dashboard."""
+    print(f"\nTop 10 {label} by installs:")
+    for o in agg["by_installs"][:10]:
+        print(f"  {o['total_installs']:>10,}  {o['count']:3d} skills  {o[key]}")
+    print(f"\nTop 10 {label} by skill count:")
+    for o in agg["by_count"][:10]:
+        print(f"  {o['count']:3d} skills  {o['total_installs']:>10,} installs  {o[key]}")
+    stats = agg.get("stats")
+    if stats:
+        print(f"\nInstall distribution:  {'skills':>14}  {label:>14}")
+        for row, skills, groups in _stat_rows(stats["skills"], stats["groups"]):
+            print(f"  {row:20s}  {skills:>14}  {groups:>14}")
+
+
+def _stat_rows(*columns: dict) -> list[tuple[str, ...]]:
+    """Formatted QuantileSketch.stats() rows: (label, one value per column)."""
+    def fmt(value, spec):
+        return "-" if value is None else format(value, spec)
+
+    rows = [(name.replace("_", "."), [fmt(c[name], ",.0f") for c in columns]) for name in STAT_QUANTILES]
+    rows += [
+        ("Gini", [fmt(c["gini"], ".3f") for c in columns]),
+        ("Top 1% share", [fmt(c["top1_share"], ".1%") for c in columns]),
+        ("Top 10% share", [fmt(c["top10_share"], ".1%") for c in columns]),
+        ("Power-law alpha", [
+            "-" if c["alpha"] is None else f"{c['alpha']:.2f} (x>={c['x_min']:,})" for c in columns
+        ]),
+    ]
+    return [(label, *values) for label, values in rows]
+
+
+EXPORT_FORMATS = ("json", "ndjson", "csv", "sqlite")
+
+
+def export_data(skills: Iterable[Skill], groups: list[dict], group_by: str, out_dir: str | Path, fmt: str) -> list[Path]:
+    """Export the ranked skills and the per-group aggregates (result()["by_installs"]).
+
+    ``json`` keeps the indented skills_raw.json / skills_owners.json
+    documents. ``ndjson`` and ``csv`` write one record per line, and
+    ``sqlite`` writes skills.sqlite3 with indexed ``skills`` and ``<group>s``
+    tables. Records are serialized one at a time into buffered files, and
+    each file is renamed into place once complete. Returns the paths written.
+    """
+    out_dir = Path(out_dir)
+    ranked = sorted(skills, key=_rank_key)
+    if fmt == "sqlite":
+        path = out_dir / "skills.sqlite3"
+        _export_sqlite(path, ranked, groups, group_by)
+        return [path]
+    skills_path, groups_path = out_dir / f"skills_raw.{fmt}", out_dir / f"skills_owners.{fmt}"
+    with _atomic_file(skills_path) as f:
+        if fmt == "json":
+            json.dump([s.to_dict() for s in ranked], f, indent=2)
+        elif fmt == "ndjson":
+            for s in ranked:
+                f.write(json.dumps(s.to_dict(), separators=(",", ":")))
+                f.write("\n")
+        else:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(("id", "name", "owner", "repo", "installs"))
+            writer.writerows((s.id, s.name, s.owner, s.source, s.installs) for s in ranked)
+    with _atomic_file(groups_path) as f:
+        if fmt == "json":
+            json.dump(groups, f, indent=2)
+        elif fmt == "ndjson":
+            for group in groups:
+                f.write(json.dumps(group, separators=(",", ":")))
+                f.write("\n")
+        else:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow((group_by, "skills", "installs", "repos"))
+            writer.writerows((g[group_by], g["count"], g["total_installs"], g["repos"]) for g in groups)
+    return [skills_path, groups_path]
+
+
+def _export_sqlite(path: Path, ranked: list[Skill], groups: list[dict], group_by: str) -> None:
+    """Build the SQLite export in a temporary file, indexing after the bulk insert."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)
+    table = f"{group_by}s"
+    try:
+        with contextlib.closing(sqlite3.connect(tmp)) as conn:
+            conn.execute("PRAGMA journal_mode=OFF")
+            conn.execute("PRAGMA synchronous=OFF")
+            with conn:
+                conn.execute(
+                    "CREATE TABLE skills (id TEXT PRIMARY KEY, name TEXT NOT NULL, owner TEXT NOT NULL,"
+                    " repo TEXT NOT NULL, installs INTEGER NOT NULL)"
+                )
+                conn.execute(
+                    f"CREATE TABLE {table} ({group_by} TEXT PRIMARY KEY, skills INTEGER NOT NULL,"
+                    " installs INTEGER NOT NULL, repos INTEGER NOT NULL)"
+                )
+                conn.executemany(
+                    "INSERT INTO skills VALUES (?, ?, ?, ?, ?)",
+                    ((s.id, s.name, s.owner, s.source, s.installs) for s in ranked),
+                )
+                conn.executemany(
+                    f"INSERT INTO {table} VALUES (?, ?, ?, ?)",
+                    ((g[group_by], g["count"], g["total_installs"], g["repos"]) for g in groups),
+                )
+                conn.execute("CREATE INDEX skills_owner ON skills (owner)")
+                conn.execute("CREATE INDEX skills_repo ON skills (repo)")
+                conn.execute("CREATE INDEX skills_installs ON skills (installs)")
+                conn.execute(f"CREATE INDEX {table}_installs ON {table} (installs)")
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def level_of_detail(
+    owners: dict,
+    max_children: int | None = DEFAULT_MAX_CHILDREN,
+    max_payload_kb: float | None = DEFAULT_MAX_PAYLOAD_KB,
+) -> dict:
+    """Bound the treemap data embedded in the dashboard.
+
+    Each ranked owner keeps at most ``max_children`` skills, and the rest are
+    rolled into one "other (N skills)" node carrying their installs. While the
+    embedded data is over ``max_payload_kb``, the cap is halved, down to owner
+    totals plus one "other" node each. Returns a new aggregate dict.
+    """
+    longest = max((len(o["skills"]) for o in owners["by_installs"]), default=0)
+    cap = longest if max_children is None else min(max_children, longest)
+    while True:
+        by_installs = [_cap_children(o, cap) for o in owners["by_installs"]]
+        lod = {**owners, "by_installs": by_installs}
+        size = _payload_bytes(lod)
+        if max_payload_kb is None or size <= max_payload_kb * 1024 or cap == 0:
+            break
+        cap //= 2
+    if max_payload_kb is not None and size > max_payload_kb * 1024:
+        print(f"Warning: dashboard data is {size / 1024:,.0f} KB even without treemap skills "
+              f"(budget {max_payload_kb:g} KB)")
+    return lod
+
+
+def _cap_children(owner: dict, cap: int) -> dict:
+    """Copy of an owner entry with at most ``cap`` skills plus an "other" roll-up node."""
+    kept = owner["skills"][:cap]
+    rest = owner["count"] - len(kept)
+    if rest > 0:
+        rest_installs = owner["total_installs"] - sum(s["installs"] for s in kept)
+        kept = kept + [{"name": f"other ({rest:,} skills)", "installs": rest_installs, "other": rest}]
+    return {**owner, "skills": kept}
+
+
+def _dashboard_data(owners: dict) -> dict:
+    """The JSON datasets the dashboard embeds, keyed by their JS variable name."""
     # Only embed data needed for charts to keep HTML small:
-    # - Top 50 skills (for top-30 bar + headroom)
-    # - Top 50 owners (for bar charts + treemap)
-    # - All install values (for histogram) as a flat array
-    top_skills = skills[:50]
-    top_owners = owners[:50]
-    all_installs = [s["installs"] for s in skills]
-
-    skills_json = json.dumps(top_skills)
-    owner_json = json.dumps(top_owners)
-    installs_json = json.dumps(all_installs)
-    today = date.today().isoformat()
-    total_installs = sum(s["installs"] for s in skills)
-    total_installs_label = f"{total_installs / 1_000_000:.1f}M"
-
-    return f'''<!DOCTYPE html>
+    # - Top skills (for top-30 bar + headroom)
+    # - Top owners by installs (for bar chart + treemap) and by skill count
+    # - Pre-binned log-scale install histogram (constant size)
+    # - Percentiles and concentration of installs per skill and per owner
+    return {
+        "skills": owners["top_skills"],
+        "owners": owners["by_installs"],
+        "ownersByCount": [{k: v for k, v in o.items() if k != "skills"} for o in owners["by_count"]],
+        "histogram": owners["histogram"],
+        "stats": owners["stats"],
+    }
+
+
+def _payload_bytes(owners: dict) -> int:
+    return sum(len(json.dumps(v)) for v in _dashboard_data(owners).values())
+
+
+def _varints(values: Iterable[int]) -> str:
+    """Base64 of the varint encoding of non-negative ``values``."""
+    out = bytearray()
+    for n in values:
+        _append_varint(out, n)
+    return base64.b64encode(out).decode("ascii")
+
+
+def _grams(text: str) -> set[str]:
+    return {text[i:i + SEARCH_GRAM] for i in range(len(text) - SEARCH_GRAM + 1)}
+
+
+def _encode_search_index(
+    docs: list[Skill], doc_grams: list[set[str]], owners: list[list], total: int
+) -> dict:
+    owner_index = {row[0]: i for i, row in enumerate(owners)}
+    repos: dict[str, int] = {}
+    postings: dict[str, list[int]] = defaultdict(list)
+    for i, (s, grams) in enumerate(zip(docs, doc_grams)):
+        repos.setdefault(s.source, len(repos))
+        for gram in grams:
+            postings[gram].append(i)
+    return {
+        "count": len(docs),
+        "total": total,
+        "names": "\n".join(s.name.replace("\n", " ") for s in docs),
+        # A repo is its owner's row in ``owners`` plus the part after "owner/".
+        "repos": "\n".join(source.partition("/")[2] for source in repos),
+        "repoOwners": _varints(owner_index[source.partition("/")[0]] for source in repos),
+        "docRepos": _varints(repos[s.source] for s in docs),
+        # Docs are in descending install order, so after the first, installs are
+        # stored as the (non-negative) drop from the previous doc.
+        "installs": _varints([docs[0].installs, *(a.installs - b.installs for a, b in zip(docs, docs[1:]))])
+        if docs else "",
+        "owners": owners,
+        "grams": {
+            gram: _varints(i - prev - 1 for prev, i in zip([-1, *ids], ids))
+            for gram, ids in sorted(postings.items())
+        },
+    }
+
+
+def _varint_size(n: int) -> int:
+    return max(1, (n.bit_length() + 6) // 7)
+
+
+def build_search_index(
+    skills: Iterable[Skill], owners: dict[str, tuple[int, int]], max_kb: float = DEFAULT_SEARCH_INDEX_KB
+) -> dict:
+    """Compact index for the dashboard's skill and publisher finder.
+
+    Skills are ranked by installs, so a doc's number is its rank. Each lowercase
+    name contributes its trigrams to an inverted index whose postings are
+    gap-encoded varints in base64; the page decodes only the lists a query
+    touches. Installs and repos are varint columns, and the publisher of every
+    indexed skill is listed with its skill count and installs (``owners`` must
+    cover every skill's owner, as Aggregator("owner").totals() does).
+
+    The index holds the most-installed skills that fit in ``max_kb``. Each
+    skill's encoded size, including its repo and publisher rows when they
+    first appear, is estimated in one pass, so the index is encoded once.
+    """
+    docs = sorted(skills, key=_rank_key)
+    doc_grams: list[set[str]] = []
+    budget = max_kb * 1024 - 200  # keys and framing of the JSON object
+    size, n = 0.0, 0
+    repo_ids: dict[str, int] = {}
+    owner_ids: dict[str, int] = {}
+    last_doc: dict[str, int] = {}
+    for i, s in enumerate(docs):
+        grams = _grams(s.name.lower())
+        cost = len(json.dumps(s.name)) + _varint_size(s.installs) * 4 / 3
+        if s.source not in repo_ids:
+            repo_ids[s.source] = len(repo_ids)
+            if s.owner not in owner_ids:
+                owner_ids[s.owner] = len(owner_ids)
+                cost += len(json.dumps([s.owner, *owners[s.owner]])) + 1
+            cost += len(json.dumps(s.source.partition("/")[2])) + _varint_size(owner_ids[s.owner]) * 4 / 3
+        cost += _varint_size(repo_ids[s.source]) * 4 / 3
+        for gram in grams:
+            prev = last_doc.get(gram, -1)
+            cost += _varint_size(i - prev - 1) * 4 / 3
+            if prev < 0:
+                cost += len(json.dumps(gram)) + 6  # "gram":"", plus base64 padding
+            last_doc[gram] = i
+        if size + cost > budget:
+            break
+        size += cost
+        n = i + 1
+        doc_grams.append(grams)
+    owner_rows = sorted(
+        ([o, *owners[o]] for o in dict.fromkeys(s.owner for s in docs[:n])), key=lambda r: (-r[2], r[0])
+    )
+    return _encode_search_index(docs[:n], doc_grams, owner_rows, len(docs))
+
+
+# Static page segments, built once at import. Only the summary block and the
+# data loader are rendered per build; see build_html.
+_PAGE_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
@@ -170,47 +1987,48 @@ def build_html(skills: list[dict], owners: list[dict]) -> str:
 <link rel="preconnect" href="https://fonts.googleapis.com">
 <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
 <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700;800&display=swap" rel="stylesheet">
-<script src="https://cdn.plot.ly/plotly-2.35.0.min.js"></script>
-<style>
-  * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-  html {{ scroll-behavior: smooth; }}
-  body {{
+'''
+
+_PAGE_STYLE = '''<style>
+  * { margin: 0; padding: 0; box-sizing: border-box; }
+  html { scroll-behavior: smooth; }
+  body {
     font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', system-ui, sans-serif;
     background: #0a0a0f;
     color: #e0e0e0;
     min-height: 100vh;
     line-height: 1.6;
-  }}
-  .container {{
+  }
+  .container {
     max-width: 1400px;
     margin: 0 auto;
     padding: 0 16px;
-  }}
+  }
 
   /* Animations */
-  @keyframes fadeInUp {{
-    from {{ opacity: 0; transform: translateY(24px); }}
-    to {{ opacity: 1; transform: translateY(0); }}
-  }}
-  @keyframes gradientShift {{
-    0%, 100% {{ background-position: 0% 50%; }}
-    50% {{ background-position: 100% 50%; }}
-  }}
-  @keyframes glowPulse {{
-    0%, 100% {{ opacity: 0.4; transform: scale(1); }}
-    50% {{ opacity: 0.7; transform: scale(1.05); }}
-  }}
-  .fade-in {{ animation: fadeInUp 0.6s ease-out both; }}
-  .d1 {{ animation-delay: 0.05s; }}
-  .d2 {{ animation-delay: 0.1s; }}
-  .d3 {{ animation-delay: 0.15s; }}
-  .d4 {{ animation-delay: 0.2s; }}
-  .d5 {{ animation-delay: 0.25s; }}
-  .d6 {{ animation-delay: 0.3s; }}
-  .d7 {{ animation-delay: 0.35s; }}
+  @keyframes fadeInUp {
+    from { opacity: 0; transform: translateY(24px); }
+    to { opacity: 1; transform: translateY(0); }
+  }
+  @keyframes gradientShift {
+    0%, 100% { background-position: 0% 50%; }
+    50% { background-position: 100% 50%; }
+  }
+  @keyframes glowPulse {
+    0%, 100% { opacity: 0.4; transform: scale(1); }
+    50% { opacity: 0.7; transform: scale(1.05); }
+  }
+  .fade-in { animation: fadeInUp 0.6s ease-out both; }
+  .d1 { animation-delay: 0.05s; }
+  .d2 { animation-delay: 0.1s; }
+  .d3 { animation-delay: 0.15s; }
+  .d4 { animation-delay: 0.2s; }
+  .d5 { animation-delay: 0.25s; }
+  .d6 { animation-delay: 0.3s; }
+  .d7 { animation-delay: 0.35s; }
 
   /* Sticky nav */
-  .nav {{
+  .nav {
     position: sticky;
     top: 0;
     z-index: 100;
@@ -219,44 +2037,44 @@ def build_html(skills: list[dict], owners: list[dict]) -> str:
     -webkit-backdrop-filter: blur(12px);
     border-bottom: 1px solid rgba(124, 58, 237, 0.15);
     padding: 12px 0;
-  }}
-  .nav-inner {{
+  }
+  .nav-inner {
     max-width: 1400px;
     margin: 0 auto;
     display: flex;
     align-items: center;
     justify-content: space-between;
     padding: 0 24px;
-  }}
-  .nav-brand {{
+  }
+  .nav-brand {
     font-weight: 800;
     font-size: 1rem;
     background: linear-gradient(135deg, #7c3aed, #06b6d4);
     -webkit-background-clip: text;
     -webkit-text-fill-color: transparent;
-  }}
-  .nav-links {{
+  }
+  .nav-links {
     display: flex;
     gap: 24px;
     list-style: none;
-  }}
-  .nav-links a {{
+  }
+  .nav-links a {
     color: #888;
     text-decoration: none;
     font-size: 0.85rem;
     font-weight: 600;
     transition: color 0.2s;
-  }}
-  .nav-links a:hover {{ color: #c4b5fd; }}
+  }
+  .nav-links a:hover { color: #c4b5fd; }
 
   /* Header */
-  .header {{
+  .header {
     text-align: center;
     padding: 60px 20px 24px;
     position: relative;
     overflow: hidden;
-  }}
-  .header::before {{
+  }
+  .header::before {
     content: '';
     position: absolute;
     top: -40%;
@@ -267,8 +2085,8 @@ def build_html(skills: list[dict], owners: list[dict]) -> str:
     background: radial-gradient(circle, rgba(124, 58, 237, 0.12) 0%, transparent 70%);
     animation: glowPulse 8s ease-in-out infinite;
     pointer-events: none;
-  }}
-  .header h1 {{
+  }
+  .header h1 {
     font-size: 2.8rem;
     font-weight: 800;
     background: linear-gradient(135deg, #7c3aed, #a78bfa, #06b6d4, #7c3aed);
@@ -278,22 +2096,22 @@ def build_html(skills: list[dict], owners: list[dict]) -> str:
     animation: gradientShift 6s ease infinite;
     margin-bottom: 10px;
     position: relative;
-  }}
-  .header .tagline {{
+  }
+  .header .tagline {
     color: #888;
     font-size: 1.05rem;
     position: relative;
-  }}
+  }
 
   /* Stat cards */
-  .stats-row {{
+  .stats-row {
     display: flex;
     justify-content: center;
     gap: 24px;
     padding: 24px 20px;
     flex-wrap: wrap;
-  }}
-  .stat {{
+  }
+  .stat {
     text-align: center;
     background: rgba(124, 58, 237, 0.06);
     backdrop-filter: blur(10px);
@@ -305,8 +2123,8 @@ def build_html(skills: list[dict], owners: list[dict]) -> str:
     transition: transform 0.3s ease, box-shadow 0.3s ease, border-color 0.3s ease;
     position: relative;
     overflow: hidden;
-  }}
-  .stat::before {{
+  }
+  .stat::before {
     content: '';
     position: absolute;
     top: 0;
@@ -316,44 +2134,44 @@ def build_html(skills: list[dict], owners: list[dict]) -> str:
     background: linear-gradient(90deg, #7c3aed, #06b6d4);
     opacity: 0;
     transition: opacity 0.3s ease;
-  }}
-  .stat:hover {{
+  }
+  .stat:hover {
     transform: translateY(-4px);
     box-shadow: 0 8px 32px rgba(124, 58, 237, 0.2);
     border-color: rgba(124, 58, 237, 0.3);
-  }}
-  .stat:hover::before {{ opacity: 1; }}
-  .stat .icon {{
+  }
+  .stat:hover::before { opacity: 1; }
+  .stat .icon {
     font-size: 1.5rem;
     margin-bottom: 6px;
-  }}
-  .stat .num {{
+  }
+  .stat .num {
     font-size: 2rem;
     font-weight: 700;
     background: linear-gradient(135deg, #7c3aed, #06b6d4);
     -webkit-background-clip: text;
     -webkit-text-fill-color: transparent;
-  }}
-  .stat .label {{
+  }
+  .stat .label {
     font-size: 0.8rem;
     color: #666;
     text-transform: uppercase;
     letter-spacing: 1.5px;
     margin-top: 4px;
-  }}
+  }
 
   /* Section dividers */
-  .section-divider {{
+  .section-divider {
     height: 1px;
     background: linear-gradient(90deg, transparent, rgba(124, 58, 237, 0.3), transparent);
     margin: 12px 0;
-  }}
+  }
 
   /* Chart sections */
-  .chart-section {{
+  .chart-section {
     padding: 24px 0;
-  }}
-  .chart-section h2 {{
+  }
+  .chart-section h2 {
     font-size: 1.3rem;
     font-weight: 700;
     margin-bottom: 4px;
@@ -362,14 +2180,14 @@ def build_html(skills: list[dict], owners: list[dict]) -> str:
     border-left: 3px solid transparent;
     border-image: linear-gradient(180deg, #7c3aed, #06b6d4) 1;
     letter-spacing: -0.01em;
-  }}
-  .chart-section .subtitle {{
+  }
+  .chart-section .subtitle {
     font-size: 0.85rem;
     color: #666;
     margin-bottom: 14px;
     padding-left: 19px;
-  }}
-  .chart-container {{
+  }
+  .chart-container {
     background: #111118;
     border-radius: 16px;
     border: 1px solid #1e1e2e;
@@ -377,60 +2195,121 @@ def build_html(skills: list[dict], owners: list[dict]) -> str:
     margin-bottom: 30px;
     box-shadow: 0 0 20px rgba(124, 58, 237, 0.06);
     transition: transform 0.3s ease, box-shadow 0.3s ease, border-color 0.3s ease;
-  }}
-  .chart-container:hover {{
+  }
+  .chart-container:hover {
     transform: translateY(-2px);
     box-shadow: 0 4px 32px rgba(124, 58, 237, 0.12);
     border-color: rgba(124, 58, 237, 0.25);
-  }}
-  .grid-2 {{
+  }
+  .grid-2 {
     display: grid;
     grid-template-columns: 1fr 1fr;
     gap: 24px;
-  }}
-  @media (max-width: 900px) {{
-    .grid-2 {{ grid-template-columns: 1fr; }}
-    .nav-links {{ gap: 12px; }}
-    .header h1 {{ font-size: 2rem; }}
-    .stats-row {{ gap: 12px; }}
-    .stat {{ min-width: 130px; padding: 16px 20px; }}
-  }}
+  }
+  @media (max-width: 900px) {
+    .grid-2 { grid-template-columns: 1fr; }
+    .nav-links { gap: 12px; }
+    .header h1 { font-size: 2rem; }
+    .stats-row { gap: 12px; }
+    .stat { min-width: 130px; padding: 16px 20px; }
+  }
+
+  /* Skill finder */
+  .search-input {
+    width: 100%;
+    background: #111118;
+    border: 1px solid #1e1e2e;
+    border-radius: 12px;
+    padding: 14px 18px;
+    color: #ddd;
+    font-size: 1rem;
+    font-family: inherit;
+    outline: none;
+    transition: border-color 0.2s, box-shadow 0.2s;
+  }
+  .search-input:focus {
+    border-color: rgba(124, 58, 237, 0.5);
+    box-shadow: 0 0 20px rgba(124, 58, 237, 0.12);
+  }
+  .search-results {
+    display: grid;
+    grid-template-columns: 2fr 1fr;
+    gap: 24px;
+    margin-top: 16px;
+  }
+  .search-results h3 {
+    font-size: 0.8rem;
+    color: #666;
+    text-transform: uppercase;
+    letter-spacing: 1.5px;
+    margin-bottom: 8px;
+  }
+  .search-results ol { list-style: none; }
+  .search-results li {
+    display: flex;
+    justify-content: space-between;
+    gap: 12px;
+    padding: 6px 0;
+    border-bottom: 1px solid #1a1a26;
+    font-size: 0.9rem;
+    color: #ccc;
+  }
+  .search-results li .meta { color: #666; white-space: nowrap; }
+  .search-results li a { color: #7c3aed; text-decoration: none; }
+  .search-results li a:hover { color: #a78bfa; }
+  .search-note { color: #555; font-size: 0.8rem; margin-top: 10px; }
+  .load-error { color: #f87171; text-align: center; margin: 24px 0; }
+
+  /* Distribution statistics */
+  .dist-stats { overflow-x: auto; margin-bottom: 30px; }
+  .dist-stats table {
+    width: 100%;
+    border-collapse: collapse;
+    font-size: 0.85rem;
+    font-variant-numeric: tabular-nums;
+  }
+  .dist-stats th, .dist-stats td { padding: 6px 14px; text-align: right; border-bottom: 1px solid #1e1e2e; }
+  .dist-stats th { color: #666; font-weight: 600; }
+  .dist-stats td:first-child, .dist-stats th:first-child { text-align: left; color: #888; }
+  @media (max-width: 900px) {
+    .search-results { grid-template-columns: 1fr; }
+  }
 
   /* Data attribution */
-  .data-attribution {{
+  .data-attribution {
     text-align: center;
     color: #444;
     font-size: 0.8rem;
     padding-bottom: 12px;
-  }}
-  .data-attribution a {{
+  }
+  .data-attribution a {
     color: #7c3aed;
     text-decoration: none;
     transition: color 0.2s;
-  }}
-  .data-attribution a:hover {{ color: #a78bfa; }}
+  }
+  .data-attribution a:hover { color: #a78bfa; }
 
   /* Install CTA */
-  .install-section {{
+  .install-section {
     text-align: center;
     padding: 40px 20px;
     margin: 20px 0;
     background: rgba(124, 58, 237, 0.04);
     border: 1px solid rgba(124, 58, 237, 0.15);
     border-radius: 16px;
-  }}
-  .install-section h2 {{
+  }
+  .install-section h2 {
     font-size: 1.3rem;
     font-weight: 700;
     color: #ccc;
     margin-bottom: 8px;
-  }}
-  .install-section .install-subtitle {{
+  }
+  .install-section .install-subtitle {
     color: #666;
     font-size: 0.9rem;
     margin-bottom: 20px;
-  }}
-  .install-code {{
+  }
+  .install-code {
     display: inline-block;
     background: #0d0d14;
     border: 1px solid rgba(124, 58, 237, 0.25);
@@ -443,37 +2322,37 @@ def build_html(skills: list[dict], owners: list[dict]) -> str:
     position: relative;
     cursor: pointer;
     transition: border-color 0.2s, box-shadow 0.2s;
-  }}
-  .install-code:hover {{
+  }
+  .install-code:hover {
     border-color: rgba(124, 58, 237, 0.5);
     box-shadow: 0 0 20px rgba(124, 58, 237, 0.15);
-  }}
-  .install-code .copy-hint {{
+  }
+  .install-code .copy-hint {
     display: block;
     font-size: 0.7rem;
     color: #555;
     margin-top: 6px;
     font-family: 'Inter', sans-serif;
     letter-spacing: 0;
-  }}
+  }
 
   /* Footer */
-  .footer {{
+  .footer {
     text-align: center;
     padding: 32px 20px;
     color: #444;
     font-size: 0.8rem;
     border-top: 1px solid rgba(124, 58, 237, 0.1);
     margin-top: 20px;
-  }}
-  .footer .footer-brand {{
+  }
+  .footer .footer-brand {
     font-weight: 700;
     background: linear-gradient(135deg, #7c3aed, #06b6d4);
     -webkit-background-clip: text;
     -webkit-text-fill-color: transparent;
-  }}
-  .footer a {{ color: #7c3aed; text-decoration: none; transition: color 0.2s; }}
-  .footer a:hover {{ color: #a78bfa; }}
+  }
+  .footer a { color: #7c3aed; text-decoration: none; transition: color 0.2s; }
+  .footer a:hover { color: #a78bfa; }
 </style>
 </head>
 <body>
@@ -482,6 +2361,7 @@ def build_html(skills: list[dict], owners: list[dict]) -> str:
   <div class="nav-inner">
     <span class="nav-brand">Skills.sh</span>
     <ul class="nav-links">
+      <li id="search-nav" hidden><a href="#search-section">Search</a></li>
       <li><a href="#publishers">Publishers</a></li>
       <li><a href="#top-skills-section">Top Skills</a></li>
       <li><a href="#treemap-section">Treemap</a></li>
@@ -492,34 +2372,20 @@ def build_html(skills: list[dict], owners: list[dict]) -> str:
 
 <div class="container">
 
-<div class="header fade-in d1">
-  <h1>Skills.sh Ecosystem Dashboard</h1>
-  <p class="tagline">Distribution of {len(skills):,} agent skills across {len(owners):,} publishers</p>
-</div>
-
-<div class="stats-row fade-in d2">
-  <div class="stat">
-    <div class="icon">&#128230;</div>
-    <div class="num">{len(skills):,}</div>
-    <div class="label">Total Skills</div>
-  </div>
-  <div class="stat">
-    <div class="icon">&#128100;</div>
-    <div class="num">{len(owners):,}</div>
-    <div class="label">Publishers</div>
-  </div>
-  <div class="stat">
-    <div class="icon">&#128193;</div>
-    <div class="num">{sum(o["repos"] for o in owners):,}</div>
-    <div class="label">Repos</div>
-  </div>
-  <div class="stat">
-    <div class="icon">&#11015;&#65039;</div>
-    <div class="num">{total_installs_label}</div>
-    <div class="label">Total Installs</div>
+'''
+
+_PAGE_CHARTS = '''
+<p class="load-error" id="load-error" hidden></p>
+<div class="chart-section fade-in d2" id="search-section" hidden>
+  <h2>Find a Skill or Publisher</h2>
+  <p class="subtitle">Search every indexed skill name and publisher by prefix or substring</p>
+  <input class="search-input" id="search-input" type="search" placeholder="e.g. react, pdf, vercel" autocomplete="off">
+  <div class="search-results">
+    <div><h3>Skills</h3><ol id="search-skills"></ol></div>
+    <div><h3>Publishers</h3><ol id="search-owners"></ol></div>
   </div>
+  <p class="search-note" id="search-note"></p>
 </div>
-<p class="data-attribution fade-in d2">Data scraped from <a href="https://skills.sh">skills.sh</a> on {today}</p>
 
 <div class="section-divider"></div>
 
@@ -556,15 +2422,12 @@ def build_html(skills: list[dict], owners: list[dict]) -> str:
 
 <div class="chart-section fade-in d6" id="distribution">
   <h2>Install Distribution: Power Law</h2>
-  <p class="subtitle">Log-scale histogram showing the long tail of skill installs</p>
+  <p class="subtitle">Log-scale histogram showing the long tail of skill installs, with percentiles and concentration below</p>
   <div class="chart-container"><div id="histogram" style="height:400px;"></div></div>
+  <div class="dist-stats" id="dist-stats"></div>
 </div>
 
 <script>
-const skills = {skills_json};
-const owners = {owner_json};
-const allInstalls = {installs_json};
-
 const plotBg = '#111118';
 const paperBg = '#111118';
 const gridColor = '#1e1e2e';
@@ -573,169 +2436,400 @@ const colorscale = [
   [0, '#1e1b4b'], [0.2, '#4c1d95'], [0.4, '#7c3aed'],
   [0.6, '#a78bfa'], [0.8, '#06b6d4'], [1, '#22d3ee']
 ];
-const defaultLayout = {{
+const defaultLayout = {
   paper_bgcolor: paperBg,
   plot_bgcolor: plotBg,
-  font: {{ color: fontColor, family: 'Inter, -apple-system, system-ui, sans-serif' }},
-  margin: {{ t: 20, b: 40, l: 50, r: 20 }},
-}};
-
-// 1. TREEMAP
-(() => {{
-  const labels = ['All Skills'];
-  const parents = [''];
-  const values = [0];
-  const texts = [''];
-  const colors = [0];
-
-  for (const o of owners) {{
-    labels.push(o.owner);
-    parents.push('All Skills');
-    values.push(o.total_installs);
-    texts.push(`${{o.owner}}<br>${{o.count}} skills<br>${{(o.total_installs/1000).toFixed(1)}}K installs`);
-    colors.push(o.total_installs);
-  }}
-
-  for (const o of owners) {{
-    for (const s of o.skills) {{
-      labels.push(`${{s.name}} (${{o.owner}})`);
-      parents.push(o.owner);
-      values.push(s.installs);
-      texts.push(`${{s.name}}<br>${{s.repo}}<br>${{(s.installs/1000).toFixed(1)}}K installs`);
-      colors.push(s.installs);
-    }}
-  }}
-
-  Plotly.newPlot('treemap', [{{
-    type: 'treemap',
-    labels, parents, values,
-    text: texts,
-    hoverinfo: 'text',
-    textinfo: 'label',
-    marker: {{
-      colors: colors,
-      colorscale: colorscale,
-      line: {{ width: 1, color: '#1e1e2e' }}
-    }},
-    pathbar: {{ visible: true, textfont: {{ color: '#ccc' }} }},
-    tiling: {{ pad: 2 }}
-  }}], {{
-    ...defaultLayout,
-    margin: {{ t: 30, b: 10, l: 10, r: 10 }},
-  }}, {{ responsive: true }});
-}})();
-
-// 2. BAR: Top 25 by count
-(() => {{
-  const top25 = owners.slice().sort((a, b) => b.count - a.count).slice(0, 25).reverse();
-  Plotly.newPlot('bar-count', [{{
-    type: 'bar',
-    orientation: 'h',
-    y: top25.map(o => o.owner),
-    x: top25.map(o => o.count),
-    text: top25.map(o => o.count),
-    textposition: 'outside',
-    textfont: {{ color: '#aaa', size: 11 }},
-    marker: {{
-      color: top25.map(o => o.count),
-      colorscale: colorscale,
-      line: {{ width: 0 }}
-    }},
-    hovertext: top25.map(o => `${{o.owner}}: ${{o.count}} skills, ${{(o.total_installs/1000).toFixed(1)}}K installs`),
-    hoverinfo: 'text'
-  }}], {{
-    ...defaultLayout,
-    xaxis: {{ gridcolor: gridColor, color: fontColor, title: 'Skills', autorange: true }},
-    yaxis: {{ color: fontColor, tickfont: {{ size: 11 }} }},
-    margin: {{ t: 10, b: 50, l: 140, r: 100 }},
-  }}, {{ responsive: true }});
-}})();
-
-// 3. BAR: Top 25 by installs
-(() => {{
-  const top25 = owners.slice(0, 25).reverse();
-  Plotly.newPlot('bar-installs', [{{
-    type: 'bar',
-    orientation: 'h',
-    y: top25.map(o => o.owner),
-    x: top25.map(o => o.total_installs),
-    text: top25.map(o => o.total_installs >= 1e6 ? (o.total_installs/1e6).toFixed(1) + 'M' : (o.total_installs/1000).toFixed(0) + 'K'),
-    textposition: 'outside',
-    textfont: {{ color: '#aaa', size: 11 }},
-    marker: {{
-      color: top25.map(o => o.total_installs),
-      colorscale: colorscale,
-      line: {{ width: 0 }}
-    }},
-    hovertext: top25.map(o => `${{o.owner}}: ${{(o.total_installs/1000).toFixed(1)}}K installs, ${{o.count}} skills`),
-    hoverinfo: 'text'
-  }}], {{
-    ...defaultLayout,
-    xaxis: {{ gridcolor: gridColor, color: fontColor, title: 'Total Installs', autorange: true }},
-    yaxis: {{ color: fontColor, tickfont: {{ size: 11 }} }},
-    margin: {{ t: 10, b: 50, l: 140, r: 100 }},
-  }}, {{ responsive: true }});
-}})();
-
-// 4. HISTOGRAM: Power law
-(() => {{
-  const installs = allInstalls;
-  Plotly.newPlot('histogram', [{{
-    type: 'histogram',
-    x: installs.map(v => Math.log10(v)),
-    nbinsx: 40,
-    marker: {{
-      color: '#7c3aed',
-      line: {{ width: 1, color: '#4c1d95' }}
-    }},
-    hovertemplate: 'Log10(installs): %{{x:.1f}}<br>Count: %{{y}}<extra></extra>'
-  }}], {{
-    ...defaultLayout,
-    xaxis: {{
-      title: 'Log10(Installs)',
-      gridcolor: gridColor, color: fontColor,
-      tickvals: [0, 0.5, 1, 1.5, 2, 2.5, 3, 3.5, 4, 4.5, 5, 5.5],
-      ticktext: ['1', '3', '10', '32', '100', '316', '1K', '3.2K', '10K', '32K', '100K', '316K']
-    }},
-    yaxis: {{ title: 'Number of Skills', gridcolor: gridColor, color: fontColor }},
-    margin: {{ t: 10, b: 60, l: 60, r: 20 }},
-    bargap: 0.05
-  }}, {{ responsive: true }});
-}})();
-
-// 5. TOP 30 INDIVIDUAL SKILLS
-(() => {{
-  const top30 = skills.slice(0, 30).reverse();
-  const ownerMap = {{}};
-  const palette = ['#7c3aed','#06b6d4','#ec4899','#f59e0b','#10b981','#ef4444','#8b5cf6','#14b8a6','#f97316','#6366f1'];
-  let idx = 0;
-  for (const s of skills.slice(0, 30)) {{
-    const o = s.source.split('/')[0];
-    if (!(o in ownerMap)) ownerMap[o] = palette[idx++ % palette.length];
-  }}
-  const colors = top30.map(s => ownerMap[s.source.split('/')[0]]);
-
-  Plotly.newPlot('top-skills', [{{
-    type: 'bar',
-    orientation: 'h',
-    y: top30.map(s => s.name),
-    x: top30.map(s => s.installs),
-    text: top30.map(s => s.installs >= 1e6 ? (s.installs/1e6).toFixed(1) + 'M' : (s.installs/1000).toFixed(1) + 'K'),
-    textposition: 'outside',
-    textfont: {{ color: '#aaa', size: 10 }},
-    marker: {{
-      color: colors,
-      line: {{ width: 0 }}
-    }},
-    hovertext: top30.map(s => `${{s.name}}<br>${{s.source}}<br>${{(s.installs/1000).toFixed(1)}}K installs`),
-    hoverinfo: 'text'
-  }}], {{
-    ...defaultLayout,
-    yaxis: {{ color: fontColor, tickfont: {{ size: 10 }} }},
-    xaxis: {{ gridcolor: gridColor, color: fontColor, title: 'Installs', autorange: true }},
-    margin: {{ t: 10, b: 50, l: 200, r: 80 }},
-  }}, {{ responsive: true }});
-}})();
+  font: { color: fontColor, family: 'Inter, -apple-system, system-ui, sans-serif' },
+  margin: { t: 20, b: 40, l: 50, r: 20 },
+};
+
+const formatInstalls = n => n >= 1e6 ? (n/1e6).toFixed(1) + 'M' : n >= 1e3 ? (n/1e3).toFixed(1) + 'K' : String(n);
+
+// Publisher detail pages (--publisher-pages), named as _owner_filename() does.
+function ownerPage(owner) {
+  const file = encodeURIComponent(owner).replace(/[!'()*]/g, c => '%' + c.charCodeAt(0).toString(16).toUpperCase());
+  return `${PUBLISHER_PAGES}/${encodeURIComponent(file + '.html')}`;
+}
+
+// Plotly label markup linking a publisher to its page, when pages were built.
+function ownerLabel(owner) {
+  const text = owner.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+  return PUBLISHER_PAGES ? `<a href="${ownerPage(owner)}" target="_self">${text}</a>` : text;
+}
+
+// Skill finder over the index from build_search_index(), decoded on first use.
+function readVarints(b64) {
+  const bytes = atob(b64);
+  const out = [];
+  let n = 0, scale = 1;
+  for (let i = 0; i < bytes.length; i++) {
+    const b = bytes.charCodeAt(i);
+    n += (b & 0x7f) * scale;
+    if (b & 0x80) {
+      scale *= 128;
+    } else {
+      out.push(n);
+      n = 0;
+      scale = 1;
+    }
+  }
+  return out;
+}
+
+function decodeSearchIndex(raw) {
+  const names = raw.count ? raw.names.split('\\n') : [];
+  const repoOwners = readVarints(raw.repoOwners);
+  const repos = raw.count ? raw.repos.split('\\n').map((tail, i) => `${raw.owners[repoOwners[i]][0]}/${tail}`) : [];
+  const installs = [];
+  let prev = 0;
+  for (const drop of readVarints(raw.installs)) installs.push(prev = (installs.length ? prev - drop : drop));
+  const postings = new Map();
+  return {
+    names,
+    lower: names.map(n => n.toLowerCase()),
+    repos: readVarints(raw.docRepos).map(r => repos[r]),
+    installs,
+    owners: raw.owners,
+    total: raw.total,
+    postings(gram) {
+      if (!postings.has(gram)) {
+        let doc = -1;
+        postings.set(gram, gram in raw.grams ? readVarints(raw.grams[gram]).map(gap => (doc += gap + 1)) : []);
+      }
+      return postings.get(gram);
+    },
+  };
+}
+
+function intersectSorted(a, b) {
+  const out = [];
+  let j = 0;
+  for (const x of a) {
+    while (j < b.length && b[j] < x) j++;
+    if (b[j] === x) out.push(x);
+  }
+  return out;
+}
+
+function searchIndex(index, query, limit = 25) {
+  const q = query.trim().toLowerCase();
+  if (!q) return { skills: [], owners: [] };
+  let candidates;
+  if (q.length >= 3) {
+    const lists = [];
+    for (let i = 0; i + 3 <= q.length; i++) lists.push(index.postings(q.slice(i, i + 3)));
+    lists.sort((a, b) => a.length - b.length);
+    candidates = lists.reduce(intersectSorted);
+  } else {
+    candidates = index.lower.keys();
+  }
+  // Docs are numbered by install rank; prefix matches are listed first.
+  const prefix = [], inner = [];
+  for (const doc of candidates) {
+    const at = index.lower[doc].indexOf(q);
+    if (at === 0) prefix.push(doc);
+    else if (at > 0) inner.push(doc);
+    if (prefix.length >= limit) break;
+  }
+  const owners = index.owners.filter(o => o[0].toLowerCase().includes(q))
+    .sort((a, b) => (b[0].toLowerCase().startsWith(q) - a[0].toLowerCase().startsWith(q)) || b[2] - a[2]);
+  return { skills: prefix.concat(inner).slice(0, limit), owners: owners.slice(0, 10) };
+}
+
+function searchRow(label, href, meta) {
+  const li = document.createElement('li');
+  const name = document.createElement('span');
+  if (href) {
+    const a = document.createElement('a');
+    a.href = href;
+    a.target = '_blank';
+    a.rel = 'noopener';
+    a.textContent = label;
+    name.appendChild(a);
+  } else {
+    name.textContent = label;
+  }
+  const info = document.createElement('span');
+  info.className = 'meta';
+  info.textContent = meta;
+  li.append(name, info);
+  return li;
+}
+
+// The index script calls receiveSearchIndex(); see _search_script_file().
+function loadSearchScript(url) {
+  return new Promise((resolve, reject) => {
+    window.receiveSearchIndex = resolve;
+    const script = document.createElement('script');
+    script.src = url;
+    script.onerror = reject;
+    document.head.appendChild(script);
+  });
+}
+
+function initSearch(loadIndex) {
+  document.getElementById('search-section').hidden = false;
+  document.getElementById('search-nav').hidden = false;
+  const input = document.getElementById('search-input');
+  const skillList = document.getElementById('search-skills');
+  const ownerList = document.getElementById('search-owners');
+  const note = document.getElementById('search-note');
+  let loading = null;
+  const load = () => loading || (loading = loadIndex().then(decodeSearchIndex).then(index => {
+    if (index.names.length < index.total) {
+      const shown = index.names.length.toLocaleString();
+      note.textContent = `Indexing the ${shown} most-installed of ${index.total.toLocaleString()} skills ` +
+        'and their publishers.';
+    }
+    return index;
+  }, () => {
+    loading = null;
+    note.textContent = 'The search index could not be loaded.';
+  }));
+  input.addEventListener('focus', load, { once: true });
+  input.addEventListener('input', () => load().then(index => {
+    if (!index) return;
+    const { skills, owners } = searchIndex(index, input.value);
+    skillList.replaceChildren(...skills.map(doc => searchRow(
+      index.names[doc], `https://github.com/${index.repos[doc]}`,
+      `${index.repos[doc]} \\u00b7 ${formatInstalls(index.installs[doc])}`)));
+    ownerList.replaceChildren(...owners.map(([owner, count, installs]) => searchRow(
+      owner, PUBLISHER_PAGES ? ownerPage(owner) : `https://github.com/${owner}`,
+      `${count.toLocaleString()} skills \\u00b7 ${formatInstalls(installs)}`)));
+  }));
+}
+
+// Plotly is loaded without blocking the page, once, when the first chart needs it.
+let plotlyReady = null;
+function loadPlotly() {
+  return plotlyReady || (plotlyReady = window.Plotly ? Promise.resolve() : new Promise((resolve, reject) => {
+    const script = document.createElement('script');
+    script.src = PLOTLY_SRC;
+    script.onload = resolve;
+    script.onerror = reject;
+    document.head.appendChild(script);
+  }));
+}
+
+// Draw a chart once its container is near the viewport ("lazy"), or right away.
+function whenVisible(id, draw) {
+  const render = () => loadPlotly().then(draw);
+  if (CHART_LOADING !== 'lazy' || !('IntersectionObserver' in window)) {
+    render();
+    return;
+  }
+  const observer = new IntersectionObserver(entries => {
+    if (entries.some(entry => entry.isIntersecting)) {
+      observer.disconnect();
+      render();
+    }
+  }, { rootMargin: '300px 0px' });
+  observer.observe(document.getElementById(id));
+}
+
+// Percentile and concentration table from the QuantileSketch stats of skills and publishers.
+function renderStats(stats) {
+  // Gini and the shares are null when every count is 0, as is alpha without a fit.
+  const orDash = f => v => v === null ? '-' : f(v);
+  const num = orDash(v => Math.round(v).toLocaleString());
+  const pct = orDash(v => (v * 100).toFixed(1) + '%');
+  const fixed3 = orDash(v => v.toFixed(3));
+  const alpha = s => `${s.alpha.toFixed(2)} (x &ge; ${s.x_min.toLocaleString()})`;
+  const rows = [
+    ['Median (p50)', s => num(s.p50)],
+    ['p90', s => num(s.p90)],
+    ['p99', s => num(s.p99)],
+    ['p99.9', s => num(s.p99_9)],
+    ['Gini coefficient', s => fixed3(s.gini)],
+    ['Top 1% share of installs', s => pct(s.top1_share)],
+    ['Top 10% share of installs', s => pct(s.top10_share)],
+    ['Power-law exponent &alpha;', s => s.alpha === null ? '-' : alpha(s)],
+  ];
+  const cell = (s, f) => `<td>${s.count ? f(s) : '-'}</td>`;
+  document.getElementById('dist-stats').innerHTML =
+    '<table><thead><tr><th>Installs</th><th>Per skill</th><th>Per publisher</th></tr></thead><tbody>' +
+    rows.map(([label, f]) => `<tr><td>${label}</td>${cell(stats.skills, f)}${cell(stats.groups, f)}</tr>`).join('') +
+    '</tbody></table>';
+}
+
+function renderDashboard({ skills, owners, ownersByCount, histogram, stats }) {
+  renderStats(stats);
+
+  // 1. TREEMAP
+  whenVisible('treemap', () => {
+    const labels = ['All Skills'];
+    const parents = [''];
+    const values = [0];
+    const texts = [''];
+    const colors = [0];
+    const templates = ['%{label}'];
+
+    for (const o of owners) {
+      labels.push(o.owner);
+      parents.push('All Skills');
+      values.push(o.total_installs);
+      texts.push(`${o.owner}<br>${o.count} skills<br>${(o.total_installs/1000).toFixed(1)}K installs`);
+      colors.push(o.total_installs);
+      templates.push(ownerLabel(o.owner));
+    }
+
+    for (const o of owners) {
+      for (const s of o.skills) {
+        labels.push(`${s.name} (${o.owner})`);
+        parents.push(o.owner);
+        values.push(s.installs);
+        texts.push(s.other
+          ? `${s.name}<br>${(s.installs/1000).toFixed(1)}K installs`
+          : `${s.name}<br>${s.repo}<br>${(s.installs/1000).toFixed(1)}K installs`);
+        colors.push(s.installs);
+        templates.push('%{label}');
+      }
+    }
+
+    Plotly.newPlot('treemap', [{
+      type: 'treemap',
+      labels, parents, values,
+      text: texts,
+      hoverinfo: 'text',
+      textinfo: 'label',
+      texttemplate: PUBLISHER_PAGES ? templates : undefined,
+      marker: {
+        colors: colors,
+        colorscale: colorscale,
+        line: { width: 1, color: '#1e1e2e' }
+      },
+      pathbar: { visible: true, textfont: { color: '#ccc' } },
+      tiling: { pad: 2 }
+    }], {
+      ...defaultLayout,
+      margin: { t: 30, b: 10, l: 10, r: 10 },
+    }, { responsive: true });
+  });
+
+  // 2. BAR: Top 25 by count
+  whenVisible('bar-count', () => {
+    const top25 = ownersByCount.slice(0, 25).reverse();
+    Plotly.newPlot('bar-count', [{
+      type: 'bar',
+      orientation: 'h',
+      y: top25.map(o => o.owner),
+      x: top25.map(o => o.count),
+      text: top25.map(o => o.count),
+      textposition: 'outside',
+      textfont: { color: '#aaa', size: 11 },
+      marker: {
+        color: top25.map(o => o.count),
+        colorscale: colorscale,
+        line: { width: 0 }
+      },
+      hovertext: top25.map(o => `${o.owner}: ${o.count} skills, ${(o.total_installs/1000).toFixed(1)}K installs`),
+      hoverinfo: 'text'
+    }], {
+      ...defaultLayout,
+      xaxis: { gridcolor: gridColor, color: fontColor, title: 'Skills', autorange: true },
+      yaxis: {
+        color: fontColor, tickfont: { size: 11 },
+        tickvals: top25.map(o => o.owner), ticktext: top25.map(o => ownerLabel(o.owner)),
+      },
+      margin: { t: 10, b: 50, l: 140, r: 100 },
+    }, { responsive: true });
+  });
+
+  // 3. BAR: Top 25 by installs
+  whenVisible('bar-installs', () => {
+    const top25 = owners.slice(0, 25).reverse();
+    Plotly.newPlot('bar-installs', [{
+      type: 'bar',
+      orientation: 'h',
+      y: top25.map(o => o.owner),
+      x: top25.map(o => o.total_installs),
+      text: top25.map(o => o.total_installs >= 1e6 ? (o.total_installs/1e6).toFixed(1) + 'M' : (o.total_installs/1000).toFixed(0) + 'K'),
+      textposition: 'outside',
+      textfont: { color: '#aaa', size: 11 },
+      marker: {
+        color: top25.map(o => o.total_installs),
+        colorscale: colorscale,
+        line: { width: 0 }
+      },
+      hovertext: top25.map(o => `${o.owner}: ${(o.total_installs/1000).toFixed(1)}K installs, ${o.count} skills`),
+      hoverinfo: 'text'
+    }], {
+      ...defaultLayout,
+      xaxis: { gridcolor: gridColor, color: fontColor, title: 'Total Installs', autorange: true },
+      yaxis: {
+        color: fontColor, tickfont: { size: 11 },
+        tickvals: top25.map(o => o.owner), ticktext: top25.map(o => ownerLabel(o.owner)),
+      },
+      margin: { t: 10, b: 50, l: 140, r: 100 },
+    }, { responsive: true });
+  });
+
+  // 4. HISTOGRAM: Power law
+  whenVisible('histogram', () => {
+    const w = histogram.bin_width;
+    const starts = histogram.counts.map((_, i) => histogram.start + i * w);
+    Plotly.newPlot('histogram', [{
+      type: 'bar',
+      x: starts.map(x => x + w / 2),
+      y: histogram.counts,
+      customdata: starts.map(x => [x, x + w]),
+      marker: {
+        color: '#7c3aed',
+        line: { width: 1, color: '#4c1d95' }
+      },
+      hovertemplate: 'Log10(installs): %{customdata[0]:.2f}-%{customdata[1]:.2f}<br>Count: %{y}<extra></extra>'
+    }], {
+      ...defaultLayout,
+      xaxis: {
+        title: 'Log10(Installs)',
+        gridcolor: gridColor, color: fontColor,
+        tickvals: [0, 0.5, 1, 1.5, 2, 2.5, 3, 3.5, 4, 4.5, 5, 5.5],
+        ticktext: ['1', '3', '10', '32', '100', '316', '1K', '3.2K', '10K', '32K', '100K', '316K']
+      },
+      yaxis: { title: 'Number of Skills', gridcolor: gridColor, color: fontColor },
+      margin: { t: 10, b: 60, l: 60, r: 20 },
+      bargap: 0.05
+    }, { responsive: true });
+  });
+
+  // 5. TOP 30 INDIVIDUAL SKILLS
+  whenVisible('top-skills', () => {
+    const top30 = skills.slice(0, 30).reverse();
+    const ownerMap = {};
+    const palette = ['#7c3aed','#06b6d4','#ec4899','#f59e0b','#10b981','#ef4444','#8b5cf6','#14b8a6','#f97316','#6366f1'];
+    let idx = 0;
+    for (const s of skills.slice(0, 30)) {
+      const o = s.source.split('/')[0];
+      if (!(o in ownerMap)) ownerMap[o] = palette[idx++ % palette.length];
+    }
+    const colors = top30.map(s => ownerMap[s.source.split('/')[0]]);
+
+    Plotly.newPlot('top-skills', [{
+      type: 'bar',
+      orientation: 'h',
+      y: top30.map(s => s.name),
+      x: top30.map(s => s.installs),
+      text: top30.map(s => s.installs >= 1e6 ? (s.installs/1e6).toFixed(1) + 'M' : (s.installs/1000).toFixed(1) + 'K'),
+      textposition: 'outside',
+      textfont: { color: '#aaa', size: 10 },
+      marker: {
+        color: colors,
+        line: { width: 0 }
+      },
+      hovertext: top30.map(s => `${s.name}<br>${s.source}<br>${(s.installs/1000).toFixed(1)}K installs`),
+      hoverinfo: 'text'
+    }], {
+      ...defaultLayout,
+      yaxis: { color: fontColor, tickfont: { size: 10 } },
+      xaxis: { gridcolor: gridColor, color: fontColor, title: 'Installs', autorange: true },
+      margin: { t: 10, b: 50, l: 200, r: 80 },
+    }, { responsive: true });
+  });
+}
+
+'''
+
+_PAGE_TAIL = '''
 </script>
 
 <div class="section-divider"></div>
@@ -760,32 +2854,902 @@ const defaultLayout = {{
 </body>
 </html>'''
 
+_TEMPLATE_HASH = hashlib.sha256("".join((_PAGE_HEAD, _PAGE_STYLE, _PAGE_CHARTS, _PAGE_TAIL)).encode()).hexdigest()
+
+
+def _render_summary(owners: dict, today: str) -> str:
+    """The header and stat cards: the only markup that depends on the data."""
+    total_installs_label = f"{owners['total_installs'] / 1_000_000:.1f}M"
+    return f'''<div class="header fade-in d1">
+  <h1>Skills.sh Ecosystem Dashboard</h1>
+  <p class="tagline">Distribution of {owners["total_skills"]:,} agent skills across {owners["total_groups"]:,} publishers</p>
+</div>
+
+<div class="stats-row fade-in d2">
+  <div class="stat">
+    <div class="icon">&#128230;</div>
+    <div class="num">{owners["total_skills"]:,}</div>
+    <div class="label">Total Skills</div>
+  </div>
+  <div class="stat">
+    <div class="icon">&#128100;</div>
+    <div class="num">{owners["total_groups"]:,}</div>
+    <div class="label">Publishers</div>
+  </div>
+  <div class="stat">
+    <div class="icon">&#128193;</div>
+    <div class="num">{owners["total_repos"]:,}</div>
+    <div class="label">Repos</div>
+  </div>
+  <div class="stat">
+    <div class="icon">&#11015;&#65039;</div>
+    <div class="num">{total_installs_label}</div>
+    <div class="label">Total Installs</div>
+  </div>
+</div>
+<p class="data-attribution fade-in d2">Data scraped from <a href="https://skills.sh">skills.sh</a> on {today}</p>
+'''
+
+
+def dashboard_hash(
+    owners: dict,
+    assets: dict[str, str] | None = None,
+    search: dict | str | None = None,
+    plotly_src: str = PLOTLY_CDN_URL,
+    chart_loading: str = "lazy",
+    publisher_pages: str | None = None,
+) -> str:
+    """Content hash of everything a build renders except the date.
+
+    Covers the embedded datasets, the summary totals, the asset URLs, the
+    search index, the script settings and the static template, so an
+    unchanged hash means the page would only differ in its "scraped on" date.
+    """
+    normalized = {
+        "data": _dashboard_data(owners),
+        "totals": [owners[k] for k in ("total_skills", "total_groups", "total_repos", "total_installs")],
+        "assets": assets,
+        "search": search,
+        "scripts": [plotly_src, chart_loading, publisher_pages],
+        "template": _TEMPLATE_HASH,
+    }
+    return hashlib.sha256(json.dumps(normalized, sort_keys=True, separators=(",", ":")).encode()).hexdigest()[:16]
+
+
+def _existing_hash(path: str) -> str | None:
+    """The dashboard-hash recorded in an existing page's <head>, if any."""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            head = f.read(4096)
+    except OSError:
+        return None
+    match = re.search(r'<meta name="skills-dashboard-hash" content="([0-9a-f]+)">', head)
+    return match.group(1) if match else None
+
+
+# Fetches every data asset in parallel, then draws the charts. Browsers refuse
+# fetch() from file:// pages, so a split page must be served over HTTP.
+_ASSET_LOADER_JS = """Promise.all(Object.entries(ASSETS).map(([name, url]) =>
+  fetch(url).then(r => r.json()).then(value => [name, value])
+)).then(entries => renderDashboard(Object.fromEntries(entries)), err => {
+  const box = document.getElementById('load-error');
+  box.textContent = location.protocol === 'file:'
+    ? 'The chart data is in separate files, which browsers do not load for pages opened from disk. ' +
+      'Serve this directory over HTTP (e.g. python3 -m http.server) or rebuild without --split-assets.'
+    : `The chart data could not be loaded (${err}).`;
+  box.hidden = false;
+});"""
+
+
+def write_assets(owners: dict, asset_dir: str | Path, base_url: str = "data") -> dict[str, str]:
+    """Write each dashboard dataset as a content-hashed JSON file; return name -> URL.
+
+    Every file gets pre-compressed ``.gz`` (and ``.br`` when the optional
+    ``brotli`` package is installed) siblings for servers that serve them
+    directly. Nothing is removed here; see prune_assets.
+    """
+    return {
+        name: f"{base_url}/{_write_asset(asset_dir, name, value)}"
+        for name, value in _dashboard_data(owners).items()
+    }
+
+
+def _asset_file(name: str, value) -> tuple[str, bytes]:
+    """Content-hashed filename and compact JSON body of one data asset."""
+    body = json.dumps(value, separators=(",", ":")).encode("utf-8")
+    return f"{name}.{hashlib.sha256(body).hexdigest()[:12]}.json", body
+
+
+def _search_script_file(index: dict) -> tuple[str, bytes]:
+    """Content-hashed filename and body of the search index as a script.
+
+    The script hands the index to receiveSearchIndex(); unlike fetch(), a
+    script tag also loads from a page opened as a local file.
+    """
+    body = f"receiveSearchIndex({json.dumps(index, separators=(',', ':'))});\n".encode("utf-8")
+    return f"search.{hashlib.sha256(body).hexdigest()[:12]}.js", body
+
+
+def write_search_script(index: dict, asset_dir: str | Path) -> str:
+    """Write the search index script (see _search_script_file) to ``asset_dir``; return its filename."""
+    return _store_asset(asset_dir, *_search_script_file(index))
+
+
+def _write_asset(asset_dir: str | Path, name: str, value) -> str:
+    """Write one content-hashed JSON asset and its compressed siblings; return its filename."""
+    return _store_asset(asset_dir, *_asset_file(name, value))
+
+
+def _store_asset(asset_dir: str | Path, filename: str, body: bytes) -> str:
+    asset_dir = Path(asset_dir)
+    asset_dir.mkdir(parents=True, exist_ok=True)
+    variants = {filename: body, f"{filename}.gz": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[f"{filename}.br"] = brotli.compress(body)
+    for variant, content in variants.items():
+        path = asset_dir / variant
+        if not path.exists():
+            _write_atomic(path, content)
+    return filename
+
+
+# A content-hashed data asset (with its compressed siblings), and a page's reference to one.
+_ASSET_FILE = re.compile(r"\w+\.[0-9a-f]{12}\.(?:json|js)(?:\.gz|\.br)?")
+_ASSET_REF = re.compile(r"data/(\w+\.[0-9a-f]{12}\.(?:json|js))")
+
+
+def asset_refs(page: str | Path) -> set[str]:
+    """Filenames of the data/ assets a written page references; empty if there is no page."""
+    try:
+        return set(_ASSET_REF.findall(Path(page).read_text(encoding="utf-8", errors="replace")))
+    except OSError:
+        return set()
+
+
+def prune_assets(asset_dir: str | Path, keep: set[str]) -> int:
+    """Delete content-hashed assets not named in ``keep``, with their siblings; return how many files.
+
+    Called with the references of both the new page and the page it replaced,
+    so a browser or CDN still holding the previous page can load its data
+    until it refetches; older generations are removed.
+    """
+    asset_dir = Path(asset_dir)
+    if not asset_dir.is_dir():
+        return 0
+    removed = 0
+    for path in asset_dir.iterdir():
+        if _ASSET_FILE.fullmatch(path.name) and path.name.removesuffix(".gz").removesuffix(".br") not in keep:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def _plotly_bundle_file(bundle: str | Path) -> tuple[str, bytes]:
+    """Content-hashed filename and body of a local Plotly bundle."""
+    body = Path(bundle).read_bytes()
+    return f"plotly.{hashlib.sha256(body).hexdigest()[:12]}.min.js", body
+
+
+def write_plotly_bundle(bundle: str | Path, out_dir: str | Path) -> str:
+    """Copy a local Plotly bundle next to the page under a content-hashed name; return its URL."""
+    filename, body = _plotly_bundle_file(bundle)
+    path = Path(out_dir) / filename
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(path, body)
+    return filename
+
+
+def build_html(
+    owners: dict,
+    assets: dict[str, str] | None = None,
+    search: dict | str | None = None,
+    plotly_src: str = PLOTLY_CDN_URL,
+    chart_loading: str = "lazy",
+    publisher_pages: str | None = None,
+) -> str:
+    """Generate the HTML dashboard from aggregate() output by owner.
+
+    By default the chart data is embedded, so the page also works when opened
+    from disk. With ``assets`` (as returned by write_assets) the page is a
+    shell that fetches the data files asynchronously, which needs HTTP.
+    ``search`` is the URL of the search index script (see
+    write_search_script), loaded when the search box is first used, or a
+    build_search_index() result to embed in the page.
+
+    Plotly is fetched from ``plotly_src`` without blocking rendering. With
+    ``chart_loading="lazy"`` each chart is built only when its section nears
+    the viewport. ``publisher_pages`` is the URL of the write_publisher_pages()
+    directory relative to the page; publisher names in the charts and search
+    results then link to their detail pages.
+    """
+    search_data = ""
+    if isinstance(search, dict):
+        search_json = json.dumps(search, separators=(",", ":")).replace("</", "<\\/")
+        search_data = f'<script type="application/json" id="search-index">{search_json}</script>\n'
+        search_loader = (
+            "\ninitSearch(() => Promise.resolve(JSON.parse(document.getElementById('search-index').textContent)));"
+        )
+    elif search is not None:
+        search_loader = f"\ninitSearch(() => loadSearchScript({json.dumps(search)}));"
+    else:
+        search_loader = ""
+    if assets is None:
+        # "</" is escaped so skill names can never close the <script> element.
+        data_json = json.dumps(_dashboard_data(owners)).replace("</", "<\\/")
+        data_loader = f"renderDashboard({data_json});"
+        preloads = ""
+    else:
+        data_loader = _ASSET_LOADER_JS.replace("ASSETS", json.dumps(assets))
+        preloads = "".join(
+            f'<link rel="preload" href="{html.escape(url)}" as="fetch" crossorigin>\n' for url in assets.values()
+        )
+    digest = dashboard_hash(owners, assets, search, plotly_src, chart_loading, publisher_pages)
+    return "".join((
+        _PAGE_HEAD,
+        f'<meta name="skills-dashboard-hash" content="{digest}">\n',
+        f'<link rel="preload" href="{html.escape(plotly_src)}" as="script">\n',
+        preloads,
+        _PAGE_STYLE,
+        _render_summary(owners, date.today().isoformat()),
+        search_data,
+        _PAGE_CHARTS,
+        f"const PLOTLY_SRC = {json.dumps(plotly_src)};\nconst CHART_LOADING = {json.dumps(chart_loading)};\n"
+        f"const PUBLISHER_PAGES = {json.dumps(publisher_pages)};\n",
+        data_loader,
+        search_loader,
+        _PAGE_TAIL,
+    ))
+
+
+# Per-publisher detail pages (--publisher-pages). The manifest maps each owner
+# to its page file and content hash, so reruns only rewrite changed owners.
+PAGES_MANIFEST = "manifest.json"
+# Fewer changed pages than this are rendered in-process: a pool would cost more to start.
+MIN_POOL_PAGES = 64
+PAGES_PER_TASK = 256
+
+_OWNER_PAGE_HEAD = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<style>
+  * { margin: 0; padding: 0; box-sizing: border-box; }
+  body {
+    font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', system-ui, sans-serif;
+    background: #0a0a0f;
+    color: #e0e0e0;
+    line-height: 1.6;
+  }
+  .container { max-width: 1000px; margin: 0 auto; padding: 32px 16px 64px; }
+  a { color: #06b6d4; text-decoration: none; }
+  a:hover { text-decoration: underline; }
+  .back { font-size: 0.85rem; }
+  h1 {
+    font-size: 2rem;
+    font-weight: 800;
+    margin: 12px 0 4px;
+    background: linear-gradient(135deg, #7c3aed, #06b6d4);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+  }
+  .tagline { color: #888; margin-bottom: 24px; }
+  h2 { font-size: 1.1rem; font-weight: 700; margin: 32px 0 8px; color: #c4b5fd; }
+  table { width: 100%; border-collapse: collapse; font-size: 0.9rem; }
+  th, td { text-align: left; padding: 6px 8px; border-bottom: 1px solid rgba(124, 58, 237, 0.15); }
+  th { color: #888; font-weight: 600; }
+  td.num, th.num { text-align: right; font-variant-numeric: tabular-nums; }
+</style>
+'''
+
+_OWNER_PAGE_HASH = hashlib.sha256(_OWNER_PAGE_HEAD.encode()).hexdigest()
+
+
+def publisher_pages_data(skills: Iterable[Skill]) -> dict[str, dict]:
+    """Detail page data for every owner: totals, repos and all skills, by installs."""
+    members: dict[str, list[Skill]] = defaultdict(list)
+    for s in skills:
+        members[s.owner].append(s)
+    pages = {}
+    for owner, group in members.items():
+        group.sort(key=_rank_key)
+        repos: dict[str, list] = {}
+        for s in group:
+            repo = repos.setdefault(s.source, [s.source, 0, 0])
+            repo[1] += 1
+            repo[2] += s.installs
+        pages[owner] = {
+            "owner": owner,
+            "count": len(group),
+            "total_installs": sum(s.installs for s in group),
+            "repos": sorted(repos.values(), key=lambda r: (-r[2], r[0])),
+            "skills": [[s.name, s.source, s.installs] for s in group],
+        }
+    return pages
+
+
+def _owner_filename(owner: str) -> str:
+    return urllib.parse.quote(owner, safe="") + ".html"
+
+
+def _owner_page_hash(data: dict, dashboard_url: str | None) -> str:
+    """Content hash of one owner page: its data, the back link and the template."""
+    key = json.dumps([data, dashboard_url, _OWNER_PAGE_HASH], separators=(",", ":"))
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def build_owner_page(data: dict, dashboard_url: str | None = None) -> str:
+    """Static HTML detail page for one publisher_pages_data() entry."""
+    owner = html.escape(data["owner"])
+    back = f'<a class="back" href="{html.escape(dashboard_url)}">&#8592; Dashboard</a>\n' if dashboard_url else ""
+    repo_rows = "".join(
+        f'<tr><td><a href="https://github.com/{html.escape(repo)}">{html.escape(repo)}</a></td>'
+        f'<td class="num">{count:,}</td><td class="num">{installs:,}</td></tr>\n'
+        for repo, count, installs in data["repos"]
+    )
+    skill_rows = "".join(
+        f'<tr><td class="num">{rank:,}</td><td>{html.escape(name)}</td><td>{html.escape(repo)}</td>'
+        f'<td class="num">{installs:,}</td></tr>\n'
+        for rank, (name, repo, installs) in enumerate(data["skills"], 1)
+    )
+    return f'''{_OWNER_PAGE_HEAD}<title>{owner} \u00b7 Skills.sh Publisher</title>
+</head>
+<body>
+<div class="container">
+{back}<h1>{owner}</h1>
+<p class="tagline">{data["count"]:,} skills in {len(data["repos"]):,} repos \u00b7 {data["total_installs"]:,} installs \u00b7
+<a href="https://github.com/{owner}">github.com/{owner}</a></p>
+<h2>Repos</h2>
+<table>
+<tr><th>Repo</th><th class="num">Skills</th><th class="num">Installs</th></tr>
+{repo_rows}</table>
+<h2>Skills</h2>
+<table>
+<tr><th class="num">#</th><th>Skill</th><th>Repo</th><th class="num">Installs</th></tr>
+{skill_rows}</table>
+</div>
+</body>
+</html>
+'''
+
+
+def _write_owner_pages(out_dir: str, pages: list[tuple[str, dict]], dashboard_url: str | None) -> int:
+    """Render and write a batch of (filename, data) pages; return the bytes written.
+
+    Module-level so ProcessPoolExecutor workers can run it.
+    """
+    written = 0
+    for filename, data in pages:
+        body = build_owner_page(data, dashboard_url).encode("utf-8")
+        _write_atomic(os.path.join(out_dir, filename), body)
+        written += len(body)
+    return written
+
+
+def write_publisher_pages(
+    skills: Iterable[Skill],
+    out_dir: str | Path,
+    dashboard_url: str | None = None,
+    workers: int | None = None,
+    force: bool = False,
+) -> dict:
+    """Write a detail page per owner into ``out_dir``, rewriting only changed ones.
+
+    Pages whose content hash matches the manifest from the previous run (and
+    whose file still exists) are skipped. The rest are rendered on a process
+    pool of ``workers`` processes (default: CPU count), or in-process when few
+    pages changed. Pages of owners that disappeared are removed. Returns
+    counts of written, unchanged and removed pages plus the bytes written.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / PAGES_MANIFEST
+    try:
+        previous = json.loads(manifest_path.read_text())["pages"]
+    except (OSError, ValueError, KeyError):
+        previous = {}
+
+    manifest = {}
+    dirty = []
+    for owner, data in publisher_pages_data(skills).items():
+        entry = manifest[owner] = {"file": _owner_filename(owner), "hash": _owner_page_hash(data, dashboard_url)}
+        if force or previous.get(owner) != entry or not (out_dir / entry["file"]).exists():
+            dirty.append((entry["file"], data))
+
+    batches = [dirty[i:i + PAGES_PER_TASK] for i in range(0, len(dirty), PAGES_PER_TASK)]
+    if len(dirty) < MIN_POOL_PAGES or workers == 1:
+        written = sum(_write_owner_pages(str(out_dir), batch, dashboard_url) for batch in batches)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_write_owner_pages, str(out_dir), batch, dashboard_url) for batch in batches]
+            written = sum(f.result() for f in futures)
+
+    removed = 0
+    for owner, entry in previous.items():
+        if owner not in manifest and isinstance(entry, dict):
+            with contextlib.suppress(FileNotFoundError):
+                (out_dir / entry["file"]).unlink()
+                removed += 1
+    _write_atomic(manifest_path, json.dumps({"pages": manifest}, sort_keys=True, separators=(",", ":")))
+    return {"written": len(dirty), "unchanged": len(manifest) - len(dirty), "removed": removed, "bytes": written}
+
+
+# --serve: how often the daemon re-polls the API by default.
+DEFAULT_POLL_MINUTES = 60
+# Options of a one-shot build that --serve rejects rather than silently ignores
+# (it always serves split assets, so --split-assets is accepted).
+SERVE_UNSUPPORTED = (
+    "output", "json", "export", "no_cache", "stale_while_revalidate", "refresh_cache", "group_by",
+    "inline_search", "force", "publisher_pages", "page_workers", "history", "profile", "metrics_json",
+)
+
+
+def _catalog_digest(skills: Iterable[Skill]) -> str:
+    """Order-independent hash of every skill's id, source and installs."""
+    h = hashlib.sha256()
+    for s in sorted(skills, key=lambda s: s.id):
+        h.update(f"{s.id}\0{s.source}\0{s.installs}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+class DashboardServer:
+    """Long-running dashboard: catalog, aggregates and rendered files stay in memory.
+
+    Each refresh() re-polls every query with a conditional request. When the
+    merged catalog has the same digest as last time (see _catalog_digest),
+    nothing is rebuilt. Otherwise the aggregates are rebuilt from it, and the
+    page is re-rendered only if its content hash moved. The digest, not the
+    cache outcomes, decides: entries another process stored while this one
+    waited on the fetch lock count as hits but may still be new data.
+
+    A threaded HTTP server answers from the in-memory files, with ETag/304
+    and gzip. The data files have content-hashed names, so they are served
+    as immutable.
+    """
+
+    def __init__(
+        self,
+        cache: _QueryCache,
+        api_base: str | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        top_k: int | None = DEFAULT_TOP_K,
+        max_children: int | None = DEFAULT_MAX_CHILDREN,
+        max_payload_kb: float | None = DEFAULT_MAX_PAYLOAD_KB,
+        search_index_kb: float = DEFAULT_SEARCH_INDEX_KB,
+        plotly_js: str | None = None,
+        chart_loading: str = "lazy",
+        host: str = "127.0.0.1",
+        port: int = 8000,
+    ):
+        self.cache = cache
+        self.api_base = api_base or API_BASE
+        self.concurrency = concurrency
+        self.top_k = top_k
+        self.max_children = max_children
+        self.max_payload_kb = max_payload_kb
+        self.search_index_kb = search_index_kb
+        self.chart_loading = chart_loading
+        self.plotly_src = PLOTLY_CDN_URL
+        self._static: dict[str, tuple] = {}
+        if plotly_js:
+            filename, body = _plotly_bundle_file(plotly_js)
+            self.plotly_src = filename
+            self._static[f"/{filename}"] = self._entry(body, "text/javascript", immutable=True)
+        self.skills: list[Skill] | None = None
+        self.aggregator: Aggregator | None = None
+        self.catalog_digest: str | None = None
+        self.digest: str | None = None
+        # path -> (body, gzipped body, etag, content type, immutable); swapped whole on each render.
+        self._files: dict[str, tuple] = dict(self._static)
+        self._data: dict[str, tuple] = {}  # data files of the current page
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @staticmethod
+    def _entry(body: bytes, content_type: str, immutable: bool = False) -> tuple:
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        return body, gzip.compress(body, compresslevel=6, mtime=0), etag, content_type, immutable
+
+    def refresh(self) -> bool:
+        """Re-poll the API; return whether the served dashboard changed."""
+        aggregator = Aggregator("owner")
+        self.cache.outcomes.clear()
+        skills = _fetch_from_api(
+            concurrency=self.concurrency,
+            cache=self.cache,
+            refresh=self.skills is not None,
+            api_base=self.api_base,
+            aggregators=[aggregator],
+        )
+        catalog_digest = _catalog_digest(skills)
+        if catalog_digest == self.catalog_digest:
+            return False
+        self.skills, self.aggregator, self.catalog_digest = skills, aggregator, catalog_digest
+        return self._render()
+
+    def _render(self) -> bool:
+        owners = self.aggregator.result(self.skills, top_k=self.top_k, skills_per_group=self.max_children)
+        owners = level_of_detail(owners, self.max_children, self.max_payload_kb)
+        data = {}
+        assets = {}
+        for name, value in _dashboard_data(owners).items():
+            filename, body = _asset_file(name, value)
+            assets[name] = f"data/{filename}"
+            data[f"/data/{filename}"] = self._entry(body, "application/json", immutable=True)
+        search = None
+        if self.search_index_kb > 0:
+            index = build_search_index(self.skills, self.aggregator.totals(), self.search_index_kb)
+            filename, body = _search_script_file(index)
+            search = f"data/{filename}"
+            data[f"/{search}"] = self._entry(body, "text/javascript", immutable=True)
+        digest = dashboard_hash(owners, assets, search, self.plotly_src, self.chart_loading)
+        if digest == self.digest:
+            return False
+        page = build_html(owners, assets, search, self.plotly_src, self.chart_loading).encode("utf-8")
+        # The previous page's data files stay served for clients that still hold that page.
+        files = {**self._static, **self._data, **data}
+        files["/"] = files["/index.html"] = self._entry(page, "text/html; charset=utf-8")
+        self._files, self._data = files, data
+        self.digest = digest
+        return True
+
+    def poll(self) -> None:
+        """refresh(), reporting the outcome; on failure the previous dashboard stays up."""
+        try:
+            changed = self.refresh()
+        except Exception as e:
+            print(f"Refresh failed ({e}); still serving dashboard {self.digest}")
+            return
+        if changed:
+            print(f"Serving dashboard {self.digest}: {len(self.skills):,} skills")
+        else:
+            print(f"No changes; still serving dashboard {self.digest}")
+
+    def start(self) -> str:
+        """Serve in a background thread; return the dashboard URL."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def run(self, poll_minutes: float = DEFAULT_POLL_MINUTES) -> None:
+        """Build the dashboard, serve it, and re-poll every ``poll_minutes`` until interrupted."""
+        self.refresh()
+        print(f"\nServing dashboard {self.digest} at {self.start()} (polling every {poll_minutes:g} min)")
+        try:
+            while True:
+                time.sleep(poll_minutes * 60)
+                self.poll()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                self._respond(send_body=True)
+
+            def do_HEAD(self):
+                self._respond(send_body=False)
+
+            def _respond(self, send_body: bool) -> None:
+                entry = daemon._files.get(urllib.parse.urlsplit(self.path).path)
+                if entry is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body, gzipped, etag, content_type, immutable = entry
+                cache_control = "public, max-age=31536000, immutable" if immutable else "no-cache"
+                tags = {t.strip().removeprefix("W/") for t in self.headers.get("If-None-Match", "").split(",")}
+                if etag in tags or "*" in tags:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Cache-Control", cache_control)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzipped
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", cache_control)
+                self.send_header("Vary", "Accept-Encoding")
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(body)
+
+        return Handler
+
+
+def _parse_address(spec: str) -> tuple[str, int]:
+    host, _, port = spec.rpartition(":")
+    try:
+        return host or "127.0.0.1", int(port)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected [HOST:]PORT, got {spec!r}")
+
 
 def main():
     parser = argparse.ArgumentParser(description="Generate skills.sh ecosystem dashboard")
     parser.add_argument("--output", "-o", default="index.html", help="Output HTML path")
-    parser.add_argument("--json", action="store_true", help="Also dump raw JSON data files")
-    parser.add_argument("--no-cache", action="store_true", help="Bypass cache and fetch fresh data")
+    parser.add_argument("--json", action="store_true", help="Also dump raw JSON data files (same as --export json)")
+    parser.add_argument(
+        "--export", action="append", default=[], choices=EXPORT_FORMATS, metavar="FORMAT",
+        help=f"Also export the skills and {'/'.join(GROUP_LABELS)} aggregates as {', '.join(EXPORT_FORMATS)} (repeatable)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Ignore cache freshness and revalidate every query with the API",
+    )
+    parser.add_argument(
+        "--cache-ttl", type=float, default=CACHE_MAX_AGE_HOURS, metavar="HOURS",
+        help=f"Hours a cached query stays fresh (default: {CACHE_MAX_AGE_HOURS})",
+    )
+    parser.add_argument(
+        "--stale-while-revalidate", type=float, default=0, metavar="HOURS",
+        help="Serve cache entries up to HOURS past their TTL at once and refresh them in the background",
+    )
+    parser.add_argument(
+        "--refresh-cache", action="store_true",
+        help="Only bring the query cache up to date, without building anything",
+    )
+    parser.add_argument(
+        "--cache-backend", choices=sorted(CACHE_BACKENDS), default="sqlite",
+        help="Cache storage: one SQLite database (default) or per-query JSON files",
+    )
+    parser.add_argument(
+        "--query-ttl", action="append", default=[], metavar="QUERY=HOURS",
+        help="Per-query cache TTL override, e.g. --query-ttl zy=24 (repeatable)",
+    )
+    parser.add_argument(
+        "--group-by", choices=sorted(GROUP_LABELS), default="owner",
+        help="Group the text summary and --json aggregates by owner (default) or repo",
+    )
+    parser.add_argument(
+        "--top", type=int, default=DEFAULT_TOP_K, metavar="K",
+        help=f"How many groups and skills to rank and embed (default: {DEFAULT_TOP_K})",
+    )
+    parser.add_argument(
+        "--max-children", type=int, default=DEFAULT_MAX_CHILDREN, metavar="N",
+        help=f"Treemap skills per publisher before the rest roll up (default: {DEFAULT_MAX_CHILDREN})",
+    )
+    parser.add_argument(
+        "--max-payload-kb", type=float, default=DEFAULT_MAX_PAYLOAD_KB, metavar="KB",
+        help=f"Budget for data embedded in the dashboard (default: {DEFAULT_MAX_PAYLOAD_KB})",
+    )
+    parser.add_argument(
+        "--search-index-kb", type=float, default=DEFAULT_SEARCH_INDEX_KB, metavar="KB",
+        help=f"Budget for the skill search index, 0 to leave it out (default: {DEFAULT_SEARCH_INDEX_KB})",
+    )
+    parser.add_argument(
+        "--inline-search", action="store_true",
+        help="Embed the search index in the page, within --max-payload-kb, instead of writing data/search.*.js",
+    )
+    parser.add_argument(
+        "--split-assets", action="store_true",
+        help="Write chart data to content-hashed files in data/ next to the output instead of inlining it",
+    )
+    parser.add_argument(
+        "--chart-loading", choices=CHART_LOADING_MODES, default="lazy",
+        help="Draw each chart when it scrolls into view (default) or all at once on load",
+    )
+    parser.add_argument(
+        "--plotly-js", metavar="PATH",
+        help="Local Plotly bundle (e.g. a bar+treemap partial build) to copy next to the page instead of the CDN",
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Rewrite the dashboard even if its content hash is unchanged",
+    )
+    parser.add_argument(
+        "--publisher-pages", metavar="DIR",
+        help="Also write a detail page for every publisher into DIR, rewriting only changed ones",
+    )
+    parser.add_argument(
+        "--page-workers", type=int, metavar="N",
+        help="Processes rendering publisher pages (default: CPU count)",
+    )
+    parser.add_argument(
+        "--history", metavar="PATH",
+        help="Append this scrape's per-skill installs to an append-only history file",
+    )
+    parser.add_argument(
+        "--serve", type=_parse_address, metavar="[HOST:]PORT",
+        help="Keep running: serve the dashboard over HTTP from memory and re-poll the API on a schedule",
+    )
+    parser.add_argument(
+        "--poll-minutes", type=float, default=DEFAULT_POLL_MINUTES, metavar="MINUTES",
+        help=f"How often --serve re-polls the API (default: {DEFAULT_POLL_MINUTES})",
+    )
+    parser.add_argument(
+        "--api-base", default=API_BASE, metavar="URL",
+        help="Search API endpoint (default: $SKILLS_API_BASE or skills.sh)",
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Print per-phase wall/CPU times, fetch stats and peak memory at the end",
+    )
+    parser.add_argument(
+        "--metrics-json", metavar="PATH",
+        help="Write per-phase timings, per-query fetch stats, cache outcomes and peak RSS as JSON",
+    )
+    parser.add_argument(
+        "--concurrency", "-j", type=int, default=DEFAULT_CONCURRENCY,
+        help=f"Number of API queries to run in parallel (default: {DEFAULT_CONCURRENCY})",
+    )
     args = parser.parse_args()
 
-    skills = fetch_skills(no_cache=args.no_cache)
-    owners = aggregate(skills)
-    print_summary(skills, owners)
-
-    if args.json:
-        json_dir = os.path.dirname(args.output) or "."
-        skills_path = os.path.join(json_dir, "skills_raw.json")
-        owners_path = os.path.join(json_dir, "skills_owners.json")
-        with open(skills_path, "w") as f:
-            json.dump(skills, f, indent=2)
-        with open(owners_path, "w") as f:
-            json.dump(owners, f, indent=2)
-        print(f"\nJSON data: {skills_path}, {owners_path}")
-
-    html = build_html(skills, owners)
-    with open(args.output, "w") as f:
-        f.write(html)
-    print(f"\nDashboard written to: {args.output} ({len(html):,} bytes)")
+    query_ttls = {}
+    for spec in args.query_ttl:
+        query, sep, hours = spec.partition("=")
+        try:
+            query_ttls[query] = float(hours)
+        except ValueError:
+            sep = ""
+        if not sep or not query:
+            parser.error(f"--query-ttl expects QUERY=HOURS, got {spec!r}")
+
+    if args.serve:
+        unsupported = [f"--{dest.replace('_', '-')}" for dest in SERVE_UNSUPPORTED
+                       if getattr(args, dest) != parser.get_default(dest)]
+        if unsupported:
+            parser.error(f"--serve does not support {', '.join(unsupported)}")
+        host, port = args.serve
+        cache = CACHE_BACKENDS[args.cache_backend](
+            max_age_hours=args.cache_ttl, query_max_age_hours=query_ttls, cache_dir=_cache_dir(args.api_base),
+        )
+        DashboardServer(
+            cache,
+            api_base=args.api_base,
+            concurrency=args.concurrency,
+            top_k=args.top,
+            max_children=args.max_children,
+            max_payload_kb=args.max_payload_kb,
+            search_index_kb=args.search_index_kb,
+            plotly_js=args.plotly_js,
+            chart_loading=args.chart_loading,
+            host=host,
+            port=port,
+        ).run(args.poll_minutes)
+        return
+
+    metrics = RunMetrics()
+    # Aggregation runs inside the fetch, as records arrive; only ranking is left after it.
+    aggregators = {g: Aggregator(g) for g in {"owner", args.group_by}}
+    with metrics.phase("fetch"):
+        skills = fetch_skills(
+            no_cache=args.no_cache,
+            concurrency=args.concurrency,
+            max_age_hours=args.cache_ttl,
+            query_max_age_hours=query_ttls,
+            cache_backend=args.cache_backend,
+            api_base=args.api_base,
+            metrics=metrics,
+            aggregators=aggregators.values(),
+            stale_hours=args.stale_while_revalidate,
+        )
+    if args.refresh_cache:
+        print(f"Cache refreshed at {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        return
+    if args.history:
+        with metrics.phase("history"):
+            store = SnapshotStore(args.history)
+            added = store.append(skills)
+        metrics.output(args.history, os.path.getsize(args.history))
+        if added:
+            print(f"History: appended snapshot {len(store.days)} to {args.history} (+{added:,} bytes)")
+        else:
+            print(f"History: no installs changed, left {args.history} as is")
+
+    with metrics.phase("rank"):
+        owners = aggregators["owner"].result(skills, top_k=args.top, skills_per_group=args.max_children)
+        summary = owners if args.group_by == "owner" else aggregators[args.group_by].result(skills, top_k=args.top)
+    with metrics.phase("summary"):
+        print_summary(summary)
+
+    formats = list(dict.fromkeys((["json"] if args.json else []) + args.export))
+    if formats:
+        export_dir = os.path.dirname(args.output) or "."
+        # Only the JSON formats carry each group's skill list; the tabular ones just need the totals.
+        members = skills if {"json", "ndjson"} & set(formats) else None
+        paths = []
+        with metrics.phase("export"):
+            groups = aggregators[args.group_by].groups(members)
+            for fmt in formats:
+                paths += export_data(skills, groups, args.group_by, export_dir, fmt)
+        for path in paths:
+            metrics.output(path, os.path.getsize(path))
+        print(f"\nExported data: {', '.join(map(str, paths))}")
+
+    with metrics.phase("level_of_detail"):
+        owners = level_of_detail(owners, args.max_children, args.max_payload_kb)
+    search_kb = args.search_index_kb
+    if args.inline_search:
+        # An embedded index shares the page's data budget with the charts.
+        search_kb = min(search_kb, args.max_payload_kb - _payload_bytes(owners) / 1024)
+    search = None
+    if search_kb > 0:
+        with metrics.phase("search_index"):
+            search = build_search_index(skills, aggregators["owner"].totals(), search_kb)
+        size = len(json.dumps(search, separators=(",", ":")))
+        print(f"\nSearch index: {search['count']:,} of {search['total']:,} skills and "
+              f"{len(search['owners']):,} publishers ({size / 1024:,.0f} KB)")
+    elif args.search_index_kb > 0:
+        print(f"\nSearch index left out: the chart data fills the {args.max_payload_kb:g} KB payload budget")
+    asset_dir = os.path.join(os.path.dirname(args.output) or ".", "data")
+    previous_assets = asset_refs(args.output)
+    if search is not None and not args.inline_search:
+        with metrics.phase("assets"):
+            filename = write_search_script(search, asset_dir)
+        search = f"data/{filename}"  # loaded on first use of the search box
+        metrics.output(os.path.join(asset_dir, filename), os.path.getsize(os.path.join(asset_dir, filename)))
+    assets = None
+    if args.split_assets:
+        with metrics.phase("assets"):
+            assets = write_assets(owners, asset_dir)
+        for url in assets.values():
+            path = os.path.join(asset_dir, os.path.basename(url))
+            metrics.output(path, os.path.getsize(path))
+        print(f"\nData assets written to: {asset_dir}/ ({', '.join(os.path.basename(u) for u in assets.values())})")
+    plotly_src = PLOTLY_CDN_URL
+    if args.plotly_js:
+        plotly_src = write_plotly_bundle(args.plotly_js, os.path.dirname(args.output) or ".")
+    pages_url = None
+    if args.publisher_pages:
+        pages_dir = Path(os.path.relpath(args.publisher_pages, os.path.dirname(args.output) or "."))
+        pages_url = urllib.parse.quote(pages_dir.as_posix())
+    digest = dashboard_hash(owners, assets, search, plotly_src, args.chart_loading, pages_url)
+    if not args.force and _existing_hash(args.output) == digest:
+        print(f"\nDashboard unchanged (content hash {digest}), left {args.output} as is")
+    else:
+        with metrics.phase("render"):
+            page = build_html(owners, assets, search, plotly_src, args.chart_loading, pages_url)
+        with metrics.phase("write"):
+            _write_atomic(args.output, page)
+        metrics.output(args.output, os.path.getsize(args.output))
+        print(f"\nDashboard written to: {args.output} ({len(page):,} bytes)")
+    # Assets of the replaced page stay for clients that still hold it; older ones go.
+    pruned = prune_assets(asset_dir, previous_assets | asset_refs(args.output))
+    if pruned:
+        print(f"Removed {pruned:,} outdated asset files from {asset_dir}/")
+
+    if args.publisher_pages:
+        dashboard_url = os.path.relpath(os.path.abspath(args.output), os.path.abspath(args.publisher_pages))
+        with metrics.phase("publisher_pages"):
+            pages = write_publisher_pages(
+                skills, args.publisher_pages, dashboard_url, workers=args.page_workers, force=args.force,
+            )
+        metrics.output(args.publisher_pages, pages["bytes"])
+        print(f"Publisher pages: wrote {pages['written']:,}, {pages['unchanged']:,} unchanged, "
+              f"removed {pages['removed']:,} in {args.publisher_pages}/")
+
+    if args.profile:
+        metrics.print_profile()
+    if args.metrics_json:
+        _write_atomic(args.metrics_json, json.dumps(metrics.report(), indent=2))
+        print(f"Metrics written to: {args.metrics_json}")
 
 
 if __name__ == "__main__":